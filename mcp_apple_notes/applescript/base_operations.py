@@ -1,18 +1,780 @@
 import asyncio
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator, MutableMapping, Sequence
+from pathlib import Path
+from typing import Any
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
 
 
 # Default timeout for AppleScript calls (seconds).
 # Large note libraries can cause Notes.app to respond slowly.
 APPLESCRIPT_TIMEOUT = 60
 
+# Seconds to wait for a freshly spawned worker to report that it is ready.
+WORKER_STARTUP_TIMEOUT = 10
+
+# Seconds to wait for a killed osascript process to exit.
+KILL_WAIT_TIMEOUT = 2.0
+
+# Compiled run-handler templates are cached here for the one-shot path, so
+# osascript can skip parsing and compiling them on every call.
+COMPILED_SCRIPT_DIR = Path.home() / "Library" / "Caches" / "mcp-apple-notes"
+
+# Column order of the per-note rows returned by the list and find scripts.
+NOTE_ROW_FIELDS = ("name", "note_id", "folder", "creation_date", "modification_date")
+
+# Record and field separators (ASCII RS and US) for delimited script output.
+# Neither can appear in note titles, IDs, folder names or date strings, so
+# values need no escaping and a single split per level parses a result.
+RECORD_SEPARATOR = "\x1e"
+FIELD_SEPARATOR = "\x1f"
+
+# Seconds a fetched folder-ID-to-name map stays valid. Folder writes made
+# through this server clear it immediately via _invalidate_caches, so the TTL
+# only bounds how long folders changed in Notes itself can show stale names.
+FOLDER_MAP_TTL = 300.0
+
+# Run-handler skeleton for compiled templates (see with_cached_account). The
+# iCloud account is resolved once and kept in a script property, which
+# survives between calls for as long as the worker holds the compiled script.
+_CACHED_ACCOUNT_TEMPLATE = """
+property cachedAccount : missing value
+property accountResolved : false
+
+on run argv
+    set usedCachedAccount to accountResolved
+    try
+        return runQuery(argv)
+    on error errMsg
+        if not usedCachedAccount then
+            return "error:iCloud account not available. Please enable iCloud Notes sync - " & errMsg
+        end if
+    end try
+    -- The cached reference may be stale (e.g. the account changed); resolve
+    -- it again and retry once. A query that failed with a freshly resolved
+    -- account is not run a second time.
+    set accountResolved to false
+    try
+        return runQuery(argv)
+    on error errMsg
+        return "error:iCloud account not available. Please enable iCloud Notes sync - " & errMsg
+    end try
+end run
+
+on runQuery(argv)
+    tell application "Notes"
+        if not accountResolved then
+            set cachedAccount to account "iCloud"
+            set accountResolved to true
+        end if
+        set primaryAccount to cachedAccount
+{query}
+    end tell
+end runQuery
+"""
+
+# Lists every folder of the account as "id US name". `folders of` only holds
+# a container's direct children, so subfolders are walked breadth-first, with
+# each level's IDs and names fetched as whole lists.
+_FOLDER_MAP_QUERY = """
+        set fieldSep to character id 31
+        set outputLines to {}
+        set AppleScript's text item delimiters to fieldSep
+        set pendingContainers to {primaryAccount}
+        repeat while (count of pendingContainers) > 0
+            set parentContainer to item 1 of pendingContainers
+            set pendingContainers to rest of pendingContainers
+            set childFolders to folders of parentContainer
+            if (count of childFolders) > 0 then
+                set folderIDs to id of every folder of parentContainer
+                set folderNames to name of every folder of parentContainer
+                repeat with i from 1 to count of folderIDs
+                    set end of outputLines to {item i of folderIDs, item i of folderNames} as string
+                end repeat
+                set pendingContainers to pendingContainers & childFolders
+            end if
+        end repeat
+        set AppleScript's text item delimiters to character id 30
+        set outputText to outputLines as string
+        set AppleScript's text item delimiters to ""
+        return outputText
+"""
+
+# Terminator written after every request sent to the persistent worker.
+_WORKER_EOF = "\x04EOF\x04\n"
+
+# Large result sets come back as a single JSON line, so lift the default
+# 64 KiB StreamReader line limit.
+_WORKER_READ_LIMIT = 64 * 1024 * 1024
+
+# JXA program run by the persistent worker. It reads framed JSON requests from
+# stdin, runs each script through OSAKit and writes one JSON line per request
+# to stdout. Plain scripts reply with the text `osascript -e` prints: text
+# results as-is, and lists and records without their outer braces or string
+# quotes, so callers parse identical output on both paths. Requests that
+# carry `args` are run-handler templates: they are compiled once, kept for the
+# life of the worker and invoked with the arguments as `argv`. A request of
+# the form {"batch": [...]} runs each entry in turn and replies with one line
+# holding every entry's response.
+_WORKER_SOURCE = r"""
+ObjC.import('Foundation');
+ObjC.import('OSAKit');
+
+var EOF = '\x04EOF\x04\n';
+var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+var language = $.OSALanguage.languageForName('AppleScript');
+var compiled = {};
+
+function send(message) {
+    var line = $(JSON.stringify(message) + '\n');
+    stdout.writeData(line.dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function fourCharCode(code) {
+    return ((code.charCodeAt(0) << 24) | (code.charCodeAt(1) << 16) |
+            (code.charCodeAt(2) << 8) | code.charCodeAt(3)) >>> 0;
+}
+
+function failure(error) {
+    var info = error[0];
+    if (!info || info.isNil()) {
+        return null;
+    }
+    var message = info.objectForKey($.OSAScriptErrorMessageKey);
+    return {ok: false, error: message.isNil() ? info.description.js : message.js};
+}
+
+function runEvent(args) {
+    var argv = $.NSAppleEventDescriptor.listDescriptor;
+    args.forEach(function (arg, i) {
+        argv.insertDescriptorAtIndex(
+            $.NSAppleEventDescriptor.descriptorWithString($(arg)), i + 1);
+    });
+    var event = $.NSAppleEventDescriptor
+        .appleEventWithEventClassEventIDTargetDescriptorReturnIDTransactionID(
+            fourCharCode('aevt'), fourCharCode('oapp'),
+            $.NSAppleEventDescriptor.currentProcessDescriptor, -1, 0);
+    event.setParamDescriptorForKeyword(argv, fourCharCode('----'));
+    return event;
+}
+
+var LIST = fourCharCode('list');
+var RECORD = fourCharCode('reco');
+var ESCAPES = {n: '\n', r: '\r', t: '\t'};
+
+// Turn AppleScript source-form display text into osascript's human-readable
+// form: string literals lose their quotes and escapes, and a top-level list
+// or record loses its braces.
+function humanize(display, compound) {
+    var text = display;
+    if (compound && text.charAt(0) == '{' && text.charAt(text.length - 1) == '}') {
+        text = text.slice(1, -1);
+    }
+    var out = '';
+    var i = 0;
+    while (i < text.length) {
+        var c = text.charAt(i++);
+        if (c != '"') {
+            out += c;
+            continue;
+        }
+        while (i < text.length && text.charAt(i) != '"') {
+            c = text.charAt(i++);
+            if (c == '\\' && i < text.length) {
+                c = text.charAt(i++);
+                c = ESCAPES[c] || c;
+            }
+            out += c;
+        }
+        i++;  // closing quote
+    }
+    return out;
+}
+
+function displayText(script, value) {
+    if (!value || value.isNil()) {
+        return '';
+    }
+    var type = value.descriptorType;
+    var compound = type == LIST || type == RECORD;
+    if (!compound) {
+        var text = value.stringValue;
+        if (text && !text.isNil()) {
+            return text.js;
+        }
+    }
+    var display = script.richTextFromDescriptor(value);
+    return (display && !display.isNil()) ? humanize(display.string.js, compound) : '';
+}
+
+function executeSource(source) {
+    var script = $.OSAScript.alloc.initWithSourceLanguage($(source), language);
+    var error = Ref();
+    var value = script.executeAndReturnError(error);
+    var failed = failure(error);
+    if (failed) {
+        return failed;
+    }
+    return {ok: true, result: displayText(script, value)};
+}
+
+function executeTemplate(source, args) {
+    var error = Ref();
+    var script = compiled[source];
+    if (!script) {
+        script = $.OSAScript.alloc.initWithSourceLanguage($(source), language);
+        script.compileAndReturnError(error);
+        var failed = failure(error);
+        if (failed) {
+            return failed;
+        }
+        compiled[source] = script;
+    }
+    var value = script.executeAppleEventError(runEvent(args), error);
+    var failed = failure(error);
+    if (failed) {
+        return failed;
+    }
+    var text = (value && !value.isNil()) ? value.stringValue : null;
+    return {ok: true, result: (text && !text.isNil()) ? text.js : ''};
+}
+
+function execute(request) {
+    if (request.args === null) {
+        return executeSource(request.script);
+    }
+    return executeTemplate(request.script, request.args);
+}
+
+function executeSafely(request) {
+    try {
+        return execute(request);
+    } catch (e) {
+        return {ok: false, error: String(e)};
+    }
+}
+
+function handle(request) {
+    if (request.batch) {
+        return {ok: true, results: request.batch.map(executeSafely)};
+    }
+    return execute(request);
+}
+
+send({ready: true});
+
+var pending = '';
+var buffer = $.NSMutableData.alloc.init;
+while (true) {
+    var chunk = stdin.availableData;
+    if (chunk.length == 0) {
+        break;
+    }
+    buffer.appendData(chunk);
+    var text = $.NSString.alloc.initWithDataEncoding(buffer, $.NSUTF8StringEncoding);
+    if (text.isNil()) {
+        continue;  // split multi-byte character, wait for the rest
+    }
+    buffer = $.NSMutableData.alloc.init;
+    pending += text.js;
+    var end = pending.indexOf(EOF);
+    while (end >= 0) {
+        var request = pending.slice(0, end);
+        pending = pending.slice(end + EOF.length);
+        try {
+            send(handle(JSON.parse(request)));
+        } catch (e) {
+            send({ok: false, error: String(e)});
+        }
+        end = pending.indexOf(EOF);
+    }
+}
+"""
+
+
+def _timeout_error(timeout: float) -> TimeoutError:
+    """Build the TimeoutError raised when an AppleScript call runs too long."""
+    return TimeoutError(
+        f"AppleScript timed out after {timeout}s. "
+        "Apple Notes may be slow due to a large number of notes. "
+        "Try a more specific query (e.g. search_notes or find_notes_by_title) "
+        "instead of listing all notes."
+    )
+
+
+async def _kill_process(process: asyncio.subprocess.Process) -> None:
+    """Kill an osascript process without draining its remaining output.
+
+    The exit wait is bounded so a process that is slow to die cannot hold the
+    caller past its timeout; pipes are closed so pending output is discarded.
+    """
+    try:
+        process.kill()
+    except ProcessLookupError:
+        pass
+    try:
+        async with async_timeout(KILL_WAIT_TIMEOUT):
+            await process.wait()
+    except asyncio.TimeoutError:
+        pass
+    for stream in (process.stdout, process.stderr):
+        if stream is not None:
+            stream.feed_eof()
+
+
+def parse_rows(result: str, fields: tuple[str, ...]) -> list[dict[str, str]]:
+    """Parse RS/US-delimited AppleScript output into a list of dicts.
+
+    Args:
+        result: Raw AppleScript output; records are separated by
+                RECORD_SEPARATOR and fields by FIELD_SEPARATOR
+        fields: Dict keys, in column order. A "note_id" column holding a
+                full Core Data ID is reduced to its primary key.
+
+    Returns:
+        One dict per record; records with fewer than len(fields) fields are
+        skipped
+    """
+    rows = (
+        parse_row(record, fields) for record in result.split(RECORD_SEPARATOR) if record
+    )
+    return [row for row in rows if row is not None]
+
+
+def parse_row(record: str, fields: tuple[str, ...]) -> dict[str, str] | None:
+    """Parse one US-delimited record, as yielded by iter_compiled_records.
+
+    Returns:
+        The record as a dict, or None if it has fewer than len(fields) fields
+    """
+    parts = record.split(FIELD_SEPARATOR, len(fields) - 1)
+    if len(parts) != len(fields):
+        return None
+    row = dict(zip(fields, parts, strict=True))
+    if "note_id" in row:
+        # Same result as NoteIDUtils.extract_primary_key, without the call
+        row["note_id"] = row["note_id"].rpartition("/")[2]
+    return row
+
+
+def parse_note_row(record: str) -> dict[str, str] | None:
+    """Parse one record in NOTE_ROW_FIELDS order.
+
+    Same result as parse_row(record, NOTE_ROW_FIELDS), but the fixed arity
+    lets the fields be unpacked straight into a dict literal, which skips
+    building the dict from zip() and looking note_id up again.
+
+    Returns:
+        The note as a dict, or None if the record has fewer than five fields
+    """
+    try:
+        name, note_id, folder, creation_date, modification_date = record.split(
+            FIELD_SEPARATOR, 4
+        )
+    except ValueError:
+        return None
+    return {
+        "name": name,
+        "note_id": note_id.rpartition("/")[2],
+        "folder": folder,
+        "creation_date": creation_date,
+        "modification_date": modification_date,
+    }
+
+
+class _WorkerPool:
+    """A single long-lived osascript process reused across AppleScript calls.
+
+    Spawning osascript costs 50-200ms per call, which dominates small queries.
+    The worker is started lazily on first use and serves one request at a
+    time. Template runs queued with ``submit`` within BATCH_WINDOW of each
+    other are sent as a single batch request, so concurrent finds share one
+    round trip. If the worker cannot be started, results are None and callers
+    fall back to a one-shot osascript process.
+
+    The worker runs a batch's entries one after another, so the batch as a
+    whole may take the sum of its entries' timeouts. Each entry still fails
+    on its own timeout, counted from ``submit``; a slow entry delays the ones
+    behind it but only fails them once their own deadlines have passed.
+    """
+
+    # Give up on the worker after this many consecutive failed starts.
+    MAX_START_FAILURES = 3
+
+    # Seconds to wait for more submissions before sending a batch, and the
+    # queue length that sends it straight away.
+    BATCH_WINDOW = 0.010
+    MAX_BATCH = 16
+
+    def __init__(self) -> None:
+        self._process: asyncio.subprocess.Process | None = None
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._start_failures = 0
+        self._queue: list[tuple[dict[str, Any], float, asyncio.Future[str | None]]] = []
+        self._batch_full: asyncio.Event | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._starting: asyncio.Task[asyncio.subprocess.Process | None] | None = None
+
+    async def run(
+        self, script: str, timeout: float, args: Sequence[str] | None = None
+    ) -> str | None:
+        """Run a script on the worker.
+
+        Args:
+            script: AppleScript source, or an `on run argv` template if `args`
+                    is given
+            timeout: Maximum seconds to wait for the result
+            args: Arguments passed to the template's run handler
+
+        Returns:
+            The script's output, or None if no worker is available
+
+        Raises:
+            TimeoutError: If no result arrives within `timeout` seconds, counting
+                          time spent waiting for the worker
+            RuntimeError: If AppleScript reports an error or the worker exits
+                          while running the script
+        """
+        if self._start_failures >= self.MAX_START_FAILURES:
+            return None
+        self._bind_to_running_loop()
+        request = {"script": script, "args": None if args is None else list(args)}
+        response = await self._exchange(request, timeout)
+        if response is None:
+            return None
+        return self._unwrap(response)
+
+    async def start(self) -> bool:
+        """Spawn the worker now instead of on the first script.
+
+        Returns:
+            True if a worker is running
+        """
+        if self._start_failures >= self.MAX_START_FAILURES:
+            return False
+        self._bind_to_running_loop()
+        assert self._lock is not None
+        async with self._lock:
+            return await self._ensure_started() is not None
+
+    async def close(self) -> None:
+        """Stop the worker; the next script starts a fresh one."""
+        await self._discard()
+
+    def submit(
+        self, script: str, timeout: float, args: Sequence[str] | None = None
+    ) -> asyncio.Future[str | None]:
+        """Queue a script to be sent to the worker with other nearby calls.
+
+        Args:
+            script: AppleScript source, or an `on run argv` template if `args`
+                    is given
+            timeout: Maximum seconds to wait for the result, counted from now
+            args: Arguments passed to the template's run handler
+
+        Returns:
+            A future resolving to the script's output, or to None if no worker
+            is available. It raises the same errors as ``run``; a worker crash
+            fails every entry still waiting in the batch.
+        """
+        loop = self._bind_to_running_loop()
+        future: asyncio.Future[str | None] = loop.create_future()
+        if self._start_failures >= self.MAX_START_FAILURES:
+            future.set_result(None)
+            return future
+
+        expiry = loop.call_later(timeout, self._expire, future, timeout)
+        future.add_done_callback(lambda _: expiry.cancel())
+        request = {"script": script, "args": None if args is None else list(args)}
+        self._queue.append((request, timeout, future))
+        assert self._batch_full is not None
+        if len(self._queue) >= self.MAX_BATCH:
+            self._batch_full.set()
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_after_window())
+        return future
+
+    async def _flush_after_window(self) -> None:
+        """Send everything queued once the batch window closes or fills."""
+        assert self._batch_full is not None
+        try:
+            async with async_timeout(self.BATCH_WINDOW):
+                await self._batch_full.wait()
+        except asyncio.TimeoutError:
+            pass
+        batch, self._queue = self._queue, []
+        self._batch_full.clear()
+        self._flush_task = None
+
+        # Callers that gave up while queued are not sent at all.
+        batch = [entry for entry in batch if not entry[2].done()]
+        if not batch:
+            return
+        try:
+            response = await self._exchange(
+                {"batch": [request for request, _, _ in batch]},
+                sum(timeout for _, timeout, _ in batch),
+            )
+            results = self._batch_results(response, len(batch))
+            for (_, _, future), result in zip(batch, results, strict=True):
+                if future.done():
+                    continue
+                if result is None:
+                    future.set_result(None)
+                    continue
+                try:
+                    future.set_result(self._unwrap(result))
+                except RuntimeError as error:
+                    future.set_exception(error)
+        except BaseException as error:
+            # Fail the callers still waiting now rather than at their own
+            # deadlines; the worker will not answer them.
+            for _, _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(error, Exception):
+                    future.set_exception(error)
+                else:
+                    future.cancel()
+            if not isinstance(error, Exception):
+                raise
+
+    @staticmethod
+    def _expire(future: asyncio.Future[str | None], timeout: float) -> None:
+        """Fail a submitted script whose own timeout passed before its result."""
+        if not future.done():
+            future.set_exception(_timeout_error(timeout))
+
+    @staticmethod
+    def _batch_results(
+        response: dict[str, Any] | None, size: int
+    ) -> list[dict[str, Any] | None]:
+        """Return one response per batch entry, or Nones if no worker ran it.
+
+        Raises:
+            RuntimeError: If the worker rejected the batch or its reply does
+                          not hold exactly one response per entry
+        """
+        if response is None:
+            return [None] * size
+        results = response.get("results")
+        if not response.get("ok") or not isinstance(results, list):
+            raise RuntimeError(
+                f"AppleScript error: {response.get('error', 'malformed batch reply')}"
+            )
+        if len(results) != size:
+            raise RuntimeError(
+                f"AppleScript error: worker returned {len(results)} results "
+                f"for a batch of {size}"
+            )
+        return results
+
+    @staticmethod
+    def _unwrap(response: dict[str, Any]) -> str:
+        """Return a worker response's output, raising if the script failed."""
+        if not response.get("ok"):
+            raise RuntimeError(f"AppleScript error: {response.get('error', '')}")
+        return str(response.get("result", "")).strip()
+
+    def _bind_to_running_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the running loop, resetting state created on another one."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            # Pipes and locks belong to the loop that created them.
+            self._reset_for_loop(loop)
+        return loop
+
+    async def _exchange(
+        self, request: dict[str, Any], timeout: float
+    ) -> dict[str, Any] | None:
+        """Send one request frame and return the worker's decoded reply.
+
+        `timeout` covers the whole call: waiting behind other requests,
+        starting the worker and reading the reply. Giving up before the frame
+        is written leaves the worker running for the calls queued behind.
+
+        Returns:
+            The response object, or None if no worker is available
+
+        Raises:
+            TimeoutError: If no reply arrives within `timeout` seconds
+            RuntimeError: If the worker exits while handling the request
+        """
+        assert self._lock is not None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            async with async_timeout(timeout):
+                await self._lock.acquire()
+        except asyncio.TimeoutError:
+            raise _timeout_error(timeout) from None
+
+        try:
+            try:
+                async with async_timeout(max(deadline - loop.time(), 0)):
+                    process = await self._ensure_started()
+            except asyncio.TimeoutError:
+                raise _timeout_error(timeout) from None
+            if process is None:
+                return None
+
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                process.stdin.write((json.dumps(request) + _WORKER_EOF).encode())
+                async with async_timeout(max(deadline - loop.time(), 0)):
+                    await process.stdin.drain()
+                    line = await process.stdout.readline()
+            except (BrokenPipeError, ConnectionResetError):
+                # The script never reached the worker, so the one-shot path
+                # can safely run it instead.
+                await self._discard()
+                return None
+            except asyncio.TimeoutError:
+                # The worker is stuck inside the script; replace it.
+                await self._discard()
+                raise _timeout_error(timeout) from None
+
+            if not line:
+                # The script may have partially run, so it must not be retried.
+                await self._discard()
+                raise RuntimeError("AppleScript error: worker exited unexpectedly")
+        finally:
+            self._lock.release()
+
+        return json.loads(line)
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process | None:
+        """Return a running worker, spawning one if needed.
+
+        The spawn runs as its own task, so a caller that times out while the
+        worker starts leaves it to come up for the next call.
+        """
+        if self._process is not None and self._process.returncode is None:
+            return self._process
+        if self._starting is None or self._starting.done():
+            self._starting = asyncio.get_running_loop().create_task(self._spawn())
+        return await asyncio.shield(self._starting)
+
+    async def _spawn(self) -> asyncio.subprocess.Process | None:
+        """Start a worker and wait for its ready line."""
+        self._process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "osascript",
+                "-l",
+                "JavaScript",
+                "-e",
+                _WORKER_SOURCE,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_WORKER_READ_LIMIT,
+            )
+        except OSError:
+            self._start_failures = self.MAX_START_FAILURES
+            return None
+
+        assert process.stdout is not None
+        try:
+            async with async_timeout(WORKER_STARTUP_TIMEOUT):
+                ready = await process.stdout.readline()
+        except asyncio.TimeoutError:
+            ready = b""
+        except BaseException:
+            # The event loop is shutting down mid-start.
+            process.kill()
+            raise
+        if not ready.startswith(b'{"ready"'):
+            self._process = process
+            await self._discard()
+            self._start_failures += 1
+            return None
+
+        self._start_failures = 0
+        self._process = process
+        return process
+
+    def _reset_for_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Forget any worker started from a different event loop."""
+        if self._process is not None and self._process.returncode is None:
+            try:
+                self._process.kill()
+            except ProcessLookupError:
+                pass
+        self._process = None
+        self._loop = loop
+        self._lock = asyncio.Lock()
+        self._queue = []
+        self._batch_full = asyncio.Event()
+        self._flush_task = None
+        self._starting = None
+
+    async def _discard(self) -> None:
+        """Kill the current worker so the next call starts a fresh one."""
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        await _kill_process(process)
+
 
 class BaseAppleScriptOperations:
     """Base class with common AppleScript execution functionality."""
 
+    # Shared by every operation class so the whole server uses one worker.
+    _worker_pool = _WorkerPool()
+
+    # Read-side result caches, cleared whenever a write operation runs.
+    _result_caches: list[MutableMapping[Any, Any]] = []
+
+    # Single-entry cache of (fetched_at, {full folder ID: folder name}).
+    _folder_map_cache: dict[str, tuple[float, dict[str, str]]] = {}
+
+    @staticmethod
+    def _register_cache(cache: MutableMapping[Any, Any]) -> None:
+        """Register a result cache to be cleared by _invalidate_caches."""
+        BaseAppleScriptOperations._result_caches.append(cache)
+
+    @staticmethod
+    def _invalidate_caches() -> None:
+        """Drop all cached read results after Notes has been modified."""
+        BaseAppleScriptOperations._folder_map_cache.clear()
+        for cache in BaseAppleScriptOperations._result_caches:
+            cache.clear()
+
+    @staticmethod
+    async def start_worker() -> bool:
+        """Start the shared osascript worker ahead of the first operation.
+
+        Returns:
+            True if the worker is running, False if calls will fall back to
+            one-shot osascript processes
+        """
+        return await BaseAppleScriptOperations._worker_pool.start()
+
+    @staticmethod
+    async def stop_worker() -> None:
+        """Stop the shared osascript worker."""
+        await BaseAppleScriptOperations._worker_pool.close()
+
     @staticmethod
     async def execute_applescript(script: str, timeout: float = APPLESCRIPT_TIMEOUT) -> str:
         """Execute AppleScript and return result.
 
+        Scripts run on a persistent osascript worker when one is available,
+        which avoids paying process start-up on every call. Otherwise a
+        one-shot osascript process is used.
+
         Args:
             script: The AppleScript to execute
             timeout: Maximum seconds to wait before raising TimeoutError (default 60s)
@@ -21,26 +783,269 @@ class BaseAppleScriptOperations:
             TimeoutError: If the script takes longer than `timeout` seconds
             RuntimeError: If AppleScript returns a non-zero exit code
         """
+        result = await BaseAppleScriptOperations._worker_pool.run(script, timeout)
+        if result is not None:
+            return result
+        return await BaseAppleScriptOperations._execute_oneshot(["-e", script], timeout)
+
+    @staticmethod
+    async def execute_compiled_applescript(
+        script: str, args: Sequence[str] = (), timeout: float = APPLESCRIPT_TIMEOUT
+    ) -> str:
+        """Execute a static `on run argv` AppleScript template with arguments.
+
+        The template is compiled once — by the persistent worker, or with
+        osacompile into COMPILED_SCRIPT_DIR for the one-shot path — and reused
+        on later calls. User-supplied values travel as `argv` items rather than
+        being spliced into the source, so they need no AppleScript escaping.
+
+        Args:
+            script: AppleScript source containing an `on run argv` handler.
+                    Must not vary between calls, or nothing is reused.
+            args: String arguments, available to the script as `argv`
+            timeout: Maximum seconds to wait before raising TimeoutError (default 60s)
+
+        Raises:
+            TimeoutError: If the script takes longer than `timeout` seconds
+            RuntimeError: If AppleScript returns a non-zero exit code
+        """
+        result = await BaseAppleScriptOperations.submit(script, args, timeout)
+        if result is not None:
+            return result
+
+        compiled_path = await BaseAppleScriptOperations._compile_script(script)
+        if compiled_path is None:
+            return await BaseAppleScriptOperations._execute_oneshot(
+                ["-e", script, *args], timeout
+            )
+        return await BaseAppleScriptOperations._execute_oneshot(
+            [compiled_path, *args], timeout
+        )
+
+    @staticmethod
+    def submit(
+        script: str, args: Sequence[str] = (), timeout: float = APPLESCRIPT_TIMEOUT
+    ) -> asyncio.Future[str | None]:
+        """Queue an `on run argv` template run on the shared worker.
+
+        Runs submitted within a few milliseconds of each other, such as finds
+        issued in parallel, reach the worker as one batch request.
+
+        Args:
+            script: AppleScript source containing an `on run argv` handler
+            args: String arguments, available to the script as `argv`
+            timeout: Maximum seconds to wait before raising TimeoutError (default 60s)
+
+        Returns:
+            A future resolving to the output, or to None if no worker is running
+        """
+        return BaseAppleScriptOperations._worker_pool.submit(
+            script, timeout, list(args)
+        )
+
+    @staticmethod
+    async def iter_compiled_records(
+        script: str,
+        args: Sequence[str] = (),
+        timeout: float = APPLESCRIPT_TIMEOUT,
+        separator: str = RECORD_SEPARATOR,
+    ) -> AsyncIterator[str]:
+        """Run a template like execute_compiled_applescript, yielding records.
+
+        The output is split on `separator`. On the one-shot path records
+        are read from osascript's stdout as they arrive, so large results are
+        never buffered whole and parsing overlaps with the script's output.
+        The worker replies in a single line, so its records are split from
+        the complete result.
+
+        Args:
+            script: AppleScript source containing an `on run argv` handler
+            args: String arguments, available to the script as `argv`
+            timeout: Maximum seconds the whole run may take (default 60s)
+            separator: Single character ending each record (default RS; use
+                       "\n" for line-oriented output)
+
+        Yields:
+            Each non-empty record, in output order
+
+        Raises:
+            TimeoutError: If the script takes longer than `timeout` seconds
+            RuntimeError: If AppleScript returns a non-zero exit code
+        """
+        result = await BaseAppleScriptOperations.submit(script, args, timeout)
+        if result is not None:
+            for record in result.split(separator):
+                if record:
+                    yield record
+            return
+
+        compiled_path = await BaseAppleScriptOperations._compile_script(script)
+        osascript_args = (
+            ["-e", script, *args] if compiled_path is None else [compiled_path, *args]
+        )
         process = await asyncio.create_subprocess_exec(
             "osascript",
-            "-e",
-            script,
+            *osascript_args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=_WORKER_READ_LIMIT,
         )
+        assert process.stdout is not None and process.stderr is not None
+        terminator = separator.encode()
+        deadline = asyncio.get_running_loop().time() + timeout
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
-            )
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                try:
+                    async with async_timeout(max(remaining, 0)):
+                        chunk = await process.stdout.readuntil(terminator)
+                except asyncio.IncompleteReadError as end:
+                    # The last record has no separator, only osascript's newline
+                    record = end.partial.decode().strip()
+                    if record:
+                        yield record
+                    break
+                record = chunk[: -len(terminator)].decode()
+                if record:
+                    yield record
+
+            remaining = deadline - asyncio.get_running_loop().time()
+            async with async_timeout(max(remaining, 0)):
+                stderr = await process.stderr.read()
+                await process.wait()
         except asyncio.TimeoutError:
-            process.kill()
-            await process.communicate()
-            raise TimeoutError(
-                f"AppleScript timed out after {timeout}s. "
-                "Apple Notes may be slow due to a large number of notes. "
-                "Try a more specific query (e.g. search_notes or find_notes_by_title) "
-                "instead of listing all notes."
+            await _kill_process(process)
+            raise _timeout_error(timeout)
+        finally:
+            # Also reached when the consumer stops iterating early.
+            if process.returncode is None:
+                await _kill_process(process)
+
+        if process.returncode != 0:
+            raise RuntimeError(f"AppleScript error: {stderr.decode()}")
+
+    @staticmethod
+    def with_cached_account(query: str) -> str:
+        """Wrap a query in a run handler that reuses one iCloud account reference.
+
+        The account is looked up on the first call and then served from a
+        script property, saving an Apple Event per call while the compiled
+        script stays loaded in the worker. If the query fails while using a
+        previously cached account, the account is resolved again and the
+        query retried once; otherwise, or if the retry fails too, an "error:"
+        result is returned.
+
+        Args:
+            query: AppleScript statements run inside `tell application "Notes"`.
+                   `primaryAccount` and `argv` are in scope; the query must end
+                   with a `return`.
+
+        Returns:
+            Source for execute_compiled_applescript
+        """
+        return _CACHED_ACCOUNT_TEMPLATE.replace("{query}", query)
+
+    @staticmethod
+    async def _fetch_folder_map() -> dict[str, str]:
+        """Return {full folder ID: folder name} for the iCloud account.
+
+        Folder IDs and names are fetched a level at a time, nested folders
+        included; the map is then reused for FOLDER_MAP_TTL seconds so
+        scripts can return a note's container ID instead of resolving its
+        folder name.
+
+        Raises:
+            RuntimeError: If AppleScript execution fails
+        """
+        cached = BaseAppleScriptOperations._folder_map_cache.get("iCloud")
+        if cached is not None and time.monotonic() - cached[0] < FOLDER_MAP_TTL:
+            return cached[1]
+
+        result = await BaseAppleScriptOperations.execute_compiled_applescript(
+            BaseAppleScriptOperations.with_cached_account(_FOLDER_MAP_QUERY)
+        )
+        if result.startswith("error:"):
+            raise RuntimeError(f"Failed to list folders: {result[6:]}")
+
+        folder_map = {
+            row["id"]: row["name"] for row in parse_rows(result, ("id", "name"))
+        }
+        BaseAppleScriptOperations._folder_map_cache["iCloud"] = (
+            time.monotonic(),
+            folder_map,
+        )
+        return folder_map
+
+    @staticmethod
+    async def _resolve_folder_names(notes: list[dict[str, str]]) -> None:
+        """Replace container IDs in each note's "folder" with the folder name.
+
+        Notes whose container is unknown or missing are reported in "Notes".
+        """
+        if not notes:
+            return
+        folder_map = await BaseAppleScriptOperations._fetch_folder_map()
+        for note in notes:
+            note["folder"] = folder_map.get(note["folder"], "Notes")
+
+    @staticmethod
+    async def _compile_script(script: str) -> str | None:
+        """Compile a template to a cached .scpt file and return its path.
+
+        Returns None if osacompile is unavailable or rejects the script; the
+        caller then runs the source directly so the real error surfaces.
+        """
+        digest = hashlib.sha256(script.encode()).hexdigest()[:16]
+        path = COMPILED_SCRIPT_DIR / f"{digest}.scpt"
+        if path.exists():
+            return str(path)
+
+        # Each call compiles into its own temporary file next to the target
+        # and renames it into place, so no caller ever sees a half-written
+        # file, even when several compile the same script at once.
+        try:
+            COMPILED_SCRIPT_DIR.mkdir(parents=True, exist_ok=True)
+            fd, partial_name = tempfile.mkstemp(
+                prefix=f"{digest}.", suffix=".scpt", dir=COMPILED_SCRIPT_DIR
+            )
+            os.close(fd)
+            partial = Path(partial_name)
+        except OSError:
+            return None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "osacompile",
+                "-o",
+                str(partial),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
+            await process.communicate(script.encode())
+            if process.returncode != 0:
+                partial.unlink(missing_ok=True)
+                return None
+            os.replace(partial, path)
+        except OSError:
+            partial.unlink(missing_ok=True)
+            return None
+        return str(path)
+
+    @staticmethod
+    async def _execute_oneshot(osascript_args: list[str], timeout: float) -> str:
+        """Execute AppleScript in a dedicated osascript process."""
+        process = await asyncio.create_subprocess_exec(
+            "osascript",
+            *osascript_args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            async with async_timeout(timeout):
+                stdout, stderr = await process.communicate()
+        except asyncio.TimeoutError:
+            await _kill_process(process)
+            raise _timeout_error(timeout)
 
         if process.returncode != 0:
             raise RuntimeError(f"AppleScript error: {stderr.decode()}")
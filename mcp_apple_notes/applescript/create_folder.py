@@ -83,6 +83,7 @@ class CreateFolderOperations(BaseAppleScriptOperations):
         """
 
         result = await CreateFolderOperations.execute_applescript(script)
+        CreateFolderOperations._invalidate_caches()
 
         if result.startswith("ERROR:"):
             raise RuntimeError(f"Failed to create folder: {result[6:]}")
@@ -177,6 +178,7 @@ class CreateFolderOperations(BaseAppleScriptOperations):
         """
 
         result = await CreateFolderOperations.execute_applescript(script)
+        CreateFolderOperations._invalidate_caches()
 
         if result.startswith("ERROR:"):
             raise RuntimeError(f"Failed to create nested folder: {result[6:]}")
@@ -77,6 +77,7 @@ class CreateNoteOperations(BaseAppleScriptOperations):
         end tell
         """
         result = await CreateNoteOperations.execute_applescript(script)
+        CreateNoteOperations._invalidate_caches()
 
         # Check if there was an error
         if result.startswith("error:"):
@@ -147,6 +148,7 @@ class CreateNoteOperations(BaseAppleScriptOperations):
         """
 
         result = await CreateNoteOperations.execute_applescript(script)
+        CreateNoteOperations._invalidate_caches()
 
         # Check if there was an error
         if result.startswith("error:"):
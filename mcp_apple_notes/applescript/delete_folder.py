@@ -90,6 +90,7 @@ class DeleteFolderOperations(BaseAppleScriptOperations):
         """
 
         result = await DeleteFolderOperations.execute_applescript(script)
+        DeleteFolderOperations._invalidate_caches()
 
         if result.startswith("error:"):
             error_msg = result[6:]
@@ -87,6 +87,7 @@ class DeleteNoteOperations(BaseAppleScriptOperations):
         """
 
         result = await DeleteNoteOperations.execute_applescript(script)
+        DeleteNoteOperations._invalidate_caches()
 
         if result.startswith("error:"):
             error_msg = result[6:]
@@ -1,26 +1,139 @@
+import time
+from collections import OrderedDict
+from contextlib import aclosing
 from datetime import datetime
+from operator import itemgetter
 
-from .base_operations import BaseAppleScriptOperations
-from .note_id_utils import NoteIDUtils
+from .base_operations import BaseAppleScriptOperations, parse_note_row
 
 # AppleScript's epoch anchor as a naive local-time datetime.
 # "January 1, 2001 00:00:00" in local time matches how AppleScript
 # stores and compares dates internally on macOS.
 _AS_EPOCH_LOCAL = datetime(2001, 1, 1, 0, 0, 0)
 
+# Recent results keyed by (date_type, after day, before day). Clients often
+# repeat the same window within a conversation; entries expire after
+# _QUERY_CACHE_TTL seconds and are dropped whenever a write operation modifies
+# Notes.
+_QUERY_CACHE: OrderedDict[tuple[str, str, str], tuple[float, list[dict[str, str]]]] = (
+    OrderedDict()
+)
+_QUERY_CACHE_SIZE = 64
+_QUERY_CACHE_TTL = 30.0
+BaseAppleScriptOperations._register_cache(_QUERY_CACHE)
+
+# Parsed 'after'/'before' strings, so repeated queries skip fromisoformat.
+_ISO_CACHE: dict[str, datetime] = {}
+_ISO_CACHE_SIZE = 256
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 date string, reusing earlier results.
+
+    Raises:
+        ValueError: If the string is not valid ISO 8601
+    """
+    parsed = _ISO_CACHE.get(value)
+    if parsed is None:
+        parsed = datetime.fromisoformat(value)
+        if len(_ISO_CACHE) >= _ISO_CACHE_SIZE:
+            _ISO_CACHE.clear()
+        _ISO_CACHE[value] = parsed
+    return parsed
+
 
 def _to_as_seconds(dt: datetime) -> int:
     """Convert a naive local datetime to seconds since AppleScript's epoch.
 
     AppleScript's 'date "January 1, 2001"' resolves to midnight local time,
     so we compute the delta in local time — no timezone conversion needed.
-    The result is a plain integer we embed directly in the script.
+    The result is a plain integer passed to the script as an argument.
     """
     # Strip any tzinfo so arithmetic stays in local time
     naive = dt.replace(tzinfo=None)
     return int((naive - _AS_EPOCH_LOCAL).total_seconds())
 
 
+def _iso_day(dt: datetime) -> str:
+    """Format the date part of dt as YYYY-MM-DD without going through strftime."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def _build_script(date_property: str, has_after: bool, has_before: bool) -> str:
+    """Render the find script for one query shape.
+
+    Locale-independent AppleScript dates are built with epoch arithmetic:
+    "January 1, 2001" is AppleScript's fixed epoch anchor and always parses
+    regardless of system locale. The offsets in seconds are read from argv,
+    so the returned text is the same for every call with this shape.
+    """
+    whose_parts = []
+    bound_lines = []
+    if has_after:
+        bound_lines.append(
+            "set afterDate to epochAnchor + ((item 1 of argv) as number)"
+        )
+        whose_parts.append(f"{date_property} >= afterDate")
+    if has_before:
+        bound_lines.append(
+            "set beforeDate to epochAnchor + ((item 2 of argv) as number)"
+        )
+        whose_parts.append(f"{date_property} <= beforeDate")
+
+    whose_clause = " and ".join(whose_parts)
+    bound_setup = "\n        ".join(bound_lines)
+
+    query = f"""
+        set epochAnchor to date "January 1, 2001"
+        {bound_setup}
+        -- Use 'whose' with epoch-based dates (locale-independent)
+        set matchingNotes to a reference to (every note of primaryAccount whose {whose_clause})
+
+        -- Fetch each property for all matches in a single Apple Event
+        set noteNames to name of matchingNotes
+        set noteIDs to id of matchingNotes
+        set creationDates to creation date of matchingNotes
+        set modDates to modification date of matchingNotes
+        -- Folder names are resolved from the cached folder map in Python
+        try
+            set containerIDs to id of container of matchingNotes
+        on error
+            set containerIDs to {{}}
+        end try
+        set haveContainers to (count of containerIDs) is (count of noteNames)
+
+        -- Fields are separated by ASCII US, records by ASCII RS
+        set fieldSep to character id 31
+        set outputLines to {{}}
+        -- Each row is a list coerced to text, joined on the field separator
+        set AppleScript's text item delimiters to fieldSep
+        repeat with i from 1 to count of noteNames
+            set containerID to ""
+            if haveContainers then set containerID to item i of containerIDs as string
+            set end of outputLines to {{item i of noteNames, item i of noteIDs, containerID, item i of creationDates, item i of modDates}} as string
+        end repeat
+
+        set AppleScript's text item delimiters to character id 30
+        set outputText to outputLines as string
+        set AppleScript's text item delimiters to ""
+        return outputText
+    """
+    return BaseAppleScriptOperations.with_cached_account(query)
+
+
+# One pre-rendered script per (date_type, has_after, has_before) shape.
+_SCRIPT_TEMPLATES = {
+    (date_type, has_after, has_before): _build_script(
+        date_property, has_after, has_before
+    )
+    for date_type, date_property in (
+        ("created", "creation date"),
+        ("modified", "modification date"),
+    )
+    for has_after, has_before in ((True, False), (False, True), (True, True))
+}
+
+
 class FindNotesByDateOperations(BaseAppleScriptOperations):
     """Operations for finding Apple Notes by creation or modification date."""
 
@@ -40,7 +153,12 @@ class FindNotesByDateOperations(BaseAppleScriptOperations):
         fail on many macOS systems. Instead we compute seconds since AppleScript's
         epoch (2001-01-01 UTC) and use:
             (date "January 1, 2001") + N seconds
-        which is locale-independent and always works.
+        which is locale-independent and always works. N is passed as a script
+        argument, so each query shape is compiled only once.
+
+        Properties of the matches are fetched as whole lists — one Apple Event
+        per property instead of one per property per note. Results are cached
+        briefly, so repeating a query skips AppleScript entirely.
 
         Args:
             date_type: Either "created" or "modified" (default: "modified")
@@ -70,7 +188,7 @@ class FindNotesByDateOperations(BaseAppleScriptOperations):
 
         if after:
             try:
-                after_dt = datetime.fromisoformat(after.strip())
+                after_dt = _parse_iso(after.strip())
             except ValueError:
                 raise ValueError(
                     f"Invalid 'after' date '{after}'. Use ISO 8601 format e.g. '2024-01-15'"
@@ -78,116 +196,67 @@ class FindNotesByDateOperations(BaseAppleScriptOperations):
 
         if before:
             try:
-                before_dt = datetime.fromisoformat(before.strip())
+                before_dt = _parse_iso(before.strip())
             except ValueError:
                 raise ValueError(
                     f"Invalid 'before' date '{before}'. Use ISO 8601 format e.g. '2024-12-31'"
                 )
 
-        # Build AppleScript date property reference
-        if date_type == "created":
-            date_property = "creation date"
-        else:
-            date_property = "modification date"
-
-        # Build locale-independent AppleScript date objects using epoch arithmetic.
-        # "January 1, 2001" is AppleScript's fixed epoch anchor — always parseable
-        # regardless of system locale. We add the offset in seconds.
-        as_epoch_anchor = 'date "January 1, 2001"'
-        whose_parts = []
+        # Bounds are widened to whole days below, so only the day matters
+        cache_key = (
+            date_type,
+            _iso_day(after_dt) if after_dt else "",
+            _iso_day(before_dt) if before_dt else "",
+        )
+        cached = _QUERY_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _QUERY_CACHE_TTL:
+            _QUERY_CACHE.move_to_end(cache_key)
+            return list(cached[1])
+
+        # The bounds travel as argv offsets in seconds from AppleScript's
+        # epoch, so the script depends only on the query shape.
+        after_arg = ""
+        before_arg = ""
         if after_dt:
             # Start of the given day (00:00:00 local)
             after_start = after_dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            after_secs = _to_as_seconds(after_start)
-            whose_parts.append(
-                f'{date_property} >= ({as_epoch_anchor} + {after_secs})'
-            )
+            after_arg = str(_to_as_seconds(after_start))
         if before_dt:
             # End of the given day (23:59:59 local)
             before_end = before_dt.replace(hour=23, minute=59, second=59, microsecond=0)
-            before_secs = _to_as_seconds(before_end)
-            whose_parts.append(
-                f'{date_property} <= ({as_epoch_anchor} + {before_secs})'
-            )
-
-        whose_clause = " and ".join(whose_parts)
-
-        script = f"""
-        tell application "Notes"
-            try
-                set primaryAccount to account "iCloud"
-                -- Use 'whose' with epoch-based dates (locale-independent)
-                set matchingNotes to (every note of primaryAccount whose {whose_clause})
-                set outputLines to {{}}
-
-                repeat with currentNote in matchingNotes
-                    set noteName to name of currentNote as string
-                    set noteID to id of currentNote as string
-                    set noteFolder to "Notes"
-                    try
-                        set noteFolder to name of container of currentNote as string
-                    on error
-                        set noteFolder to "Notes"
-                    end try
-                    set creationDate to creation date of currentNote as string
-                    set modDate to modification date of currentNote as string
-                    set outputLines to outputLines & {{noteName & "|||" & noteID & "|||" & noteFolder & "|||" & creationDate & "|||" & modDate}}
-                end repeat
-
-                set AppleScript's text item delimiters to return
-                set outputText to outputLines as string
-                set AppleScript's text item delimiters to ""
-                return outputText
-            on error errMsg
-                return "error:iCloud account not available. Please enable iCloud Notes sync - " & errMsg
-            end try
-        end tell
-        """
-
-        result = await FindNotesByDateOperations.execute_applescript(script)
+            before_arg = str(_to_as_seconds(before_end))
+        shape = (date_type, after_dt is not None, before_dt is not None)
+        script = _SCRIPT_TEMPLATES[shape]
 
-        if result.startswith("error:"):
-            raise RuntimeError(f"Failed to find notes by date: {result[6:]}")
-
-        notes = FindNotesByDateOperations._parse_results(result)
+        # Records are parsed as they stream in; a failed query comes back as
+        # a single "error:" record.
+        notes = []
+        first = True
+        async with aclosing(
+            FindNotesByDateOperations.iter_compiled_records(
+                script, [after_arg, before_arg]
+            )
+        ) as records:
+            async for record in records:
+                if first and record.startswith("error:"):
+                    raise RuntimeError(f"Failed to find notes by date: {record[6:]}")
+                first = False
+                note = parse_note_row(record)
+                if note is not None:
+                    notes.append(note)
+        await FindNotesByDateOperations._resolve_folder_names(notes)
 
         # Sort newest first by the relevant date field
         sort_key = "modification_date" if date_type == "modified" else "creation_date"
-        notes.sort(key=lambda n: n.get(sort_key, ""), reverse=True)
+        # Every parsed row has all NOTE_ROW_FIELDS, so itemgetter is safe
+        notes.sort(key=itemgetter(sort_key), reverse=True)
 
-        return notes
+        _QUERY_CACHE[cache_key] = (time.monotonic(), notes)
+        _QUERY_CACHE.move_to_end(cache_key)
+        if len(_QUERY_CACHE) > _QUERY_CACHE_SIZE:
+            _QUERY_CACHE.popitem(last=False)
+
+        return list(notes)
 
-    @staticmethod
-    def _parse_results(result: str) -> list[dict[str, str]]:
-        """Parse AppleScript output into list of note dicts."""
-        if not result or not result.strip():
-            return []
-
-        notes: list[dict[str, str]] = []
-        # AppleScript 'return' separator can be \r or \n depending on macOS version
-        for line in result.strip().replace("\r\n", "\n").replace("\r", "\n").split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split("|||")
-            if len(parts) < 5:
-                continue
-            note_name, full_id, folder, creation_date, mod_date = (
-                parts[0],
-                parts[1],
-                parts[2],
-                parts[3],
-                parts[4],
-            )
-            notes.append(
-                {
-                    "note_id": NoteIDUtils.extract_primary_key(full_id),
-                    "name": note_name,
-                    "folder": folder,
-                    "creation_date": creation_date,
-                    "modification_date": mod_date,
-                }
-            )
-        return notes
 
 # Made with Bob
@@ -1,5 +1,52 @@
-from .base_operations import BaseAppleScriptOperations
-from .note_id_utils import NoteIDUtils
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+from .base_operations import BaseAppleScriptOperations, parse_note_row
+
+# Finds notes by title; argv is {title, "1" for an exact match else "0"}. Both
+# match modes share this one script, so it compiles once and needs no escaping.
+_TITLE_QUERY = """
+        set searchTitle to item 1 of argv
+        -- Use 'whose' to let Notes filter natively — much faster than looping.
+        -- 'contains' in a whose clause is case-insensitive in AppleScript.
+        if (item 2 of argv) is "1" then
+            set matchingNotes to a reference to (every note of primaryAccount whose name is searchTitle)
+        else
+            set matchingNotes to a reference to (every note of primaryAccount whose name contains searchTitle)
+        end if
+
+        -- Fetch each property for all matches in a single Apple Event.
+        -- IDs come first so a miss costs one event, not five.
+        set noteIDs to id of matchingNotes
+        if (count of noteIDs) is 0 then return ""
+        set noteNames to name of matchingNotes
+        set creationDates to creation date of matchingNotes
+        set modDates to modification date of matchingNotes
+        -- Folder names are resolved from the cached folder map in Python
+        try
+            set containerIDs to id of container of matchingNotes
+        on error
+            set containerIDs to {}
+        end try
+        set haveContainers to (count of containerIDs) is (count of noteNames)
+
+        -- Fields are separated by ASCII US, records by ASCII RS
+        set fieldSep to character id 31
+        set outputLines to {}
+        -- Each row is a list coerced to text, joined on the field separator
+        set AppleScript's text item delimiters to fieldSep
+        repeat with i from 1 to count of noteNames
+            set containerID to ""
+            if haveContainers then set containerID to item i of containerIDs as string
+            set end of outputLines to {item i of noteNames, item i of noteIDs, containerID, item i of creationDates, item i of modDates} as string
+        end repeat
+
+        set AppleScript's text item delimiters to character id 30
+        set outputText to outputLines as string
+        set AppleScript's text item delimiters to ""
+        return outputText
+"""
+_TITLE_SCRIPT = BaseAppleScriptOperations.with_cached_account(_TITLE_QUERY)
 
 
 class FindNotesByTitleOperations(BaseAppleScriptOperations):
@@ -17,6 +64,10 @@ class FindNotesByTitleOperations(BaseAppleScriptOperations):
 
         For exact match, 'whose name is' is used (also native).
 
+        Properties of the matches are fetched as whole lists — one Apple Event
+        per property instead of one per property per note — and a title with
+        no matches returns after a single event.
+
         Args:
             title: The title text to search for
             exact: If True, requires an exact case-sensitive match.
@@ -27,90 +78,57 @@ class FindNotesByTitleOperations(BaseAppleScriptOperations):
             modification_date
 
         Raises:
+            ValueError: If the title is empty
             RuntimeError: If AppleScript execution fails
         """
-        if not title or not title.strip():
-            raise ValueError("Title search string cannot be empty")
+        return [
+            note
+            async for note in FindNotesByTitleOperations.iter_notes_by_title(
+                title, exact
+            )
+        ]
 
-        title = title.strip()
-        # Escape double quotes for AppleScript string literal
-        escaped_title = title.replace("\\", "\\\\").replace('"', '\\"')
-
-        if exact:
-            whose_clause = f'whose name is "{escaped_title}"'
-        else:
-            # 'contains' in a whose clause is case-insensitive in AppleScript
-            whose_clause = f'whose name contains "{escaped_title}"'
-
-        script = f"""
-        tell application "Notes"
-            try
-                set primaryAccount to account "iCloud"
-                -- Use 'whose' to let Notes filter natively — much faster than looping
-                set matchingNotes to (every note of primaryAccount {whose_clause})
-                set outputLines to {{}}
-
-                repeat with currentNote in matchingNotes
-                    set noteName to name of currentNote as string
-                    set noteID to id of currentNote as string
-                    set noteFolder to "Notes"
-                    try
-                        set noteFolder to name of container of currentNote as string
-                    on error
-                        set noteFolder to "Notes"
-                    end try
-                    set creationDate to creation date of currentNote as string
-                    set modDate to modification date of currentNote as string
-                    set outputLines to outputLines & {{noteName & "|||" & noteID & "|||" & noteFolder & "|||" & creationDate & "|||" & modDate}}
-                end repeat
-
-                set AppleScript's text item delimiters to return
-                set outputText to outputLines as string
-                set AppleScript's text item delimiters to ""
-                return outputText
-            on error errMsg
-                return "error:iCloud account not available. Please enable iCloud Notes sync - " & errMsg
-            end try
-        end tell
-        """
+    @staticmethod
+    async def iter_notes_by_title(
+        title: str, exact: bool = False
+    ) -> AsyncIterator[dict[str, str]]:
+        """Yield find_notes_by_title results as each record arrives.
 
-        result = await FindNotesByTitleOperations.execute_applescript(script)
+        Args:
+            title: The title text to search for
+            exact: If True, requires an exact case-sensitive match
 
-        if result.startswith("error:"):
-            raise RuntimeError(f"Failed to find notes by title: {result[6:]}")
+        Yields:
+            Dictionaries with note_id, name, folder, creation_date,
+            modification_date
 
-        return FindNotesByTitleOperations._parse_results(result)
+        Raises:
+            ValueError: If the title is empty
+            RuntimeError: If AppleScript execution fails
+        """
+        if not title or not title.strip():
+            raise ValueError("Title search string cannot be empty")
 
-    @staticmethod
-    def _parse_results(result: str) -> list[dict[str, str]]:
-        """Parse AppleScript output into list of note dicts."""
-        if not result or not result.strip():
-            return []
-
-        notes: list[dict[str, str]] = []
-        for line in result.strip().split("\r"):
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split("|||")
-            if len(parts) < 5:
-                continue
-            note_name, full_id, folder, creation_date, mod_date = (
-                parts[0],
-                parts[1],
-                parts[2],
-                parts[3],
-                parts[4],
-            )
-            notes.append(
-                {
-                    "note_id": NoteIDUtils.extract_primary_key(full_id),
-                    "name": note_name,
-                    "folder": folder,
-                    "creation_date": creation_date,
-                    "modification_date": mod_date,
-                }
+        title = title.strip()
+
+        first = True
+        folder_map: dict[str, str] | None = None
+        async with aclosing(
+            FindNotesByTitleOperations.iter_compiled_records(
+                _TITLE_SCRIPT, [title, "1" if exact else "0"]
             )
-        return notes
+        ) as records:
+            async for record in records:
+                if first and record.startswith("error:"):
+                    raise RuntimeError(f"Failed to find notes by title: {record[6:]}")
+                first = False
+                note = parse_note_row(record)
+                if note is None:
+                    continue
+                if folder_map is None:
+                    folder_map = await FindNotesByTitleOperations._fetch_folder_map()
+                note["folder"] = folder_map.get(note["folder"], "Notes")
+                yield note
+
 
 # Made with Bob
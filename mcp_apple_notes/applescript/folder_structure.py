@@ -20,37 +20,37 @@ tell application "Notes"
 		repeat with rootFolder in folders of primaryAccount
 			set rootName to name of rootFolder
 			set rootId to id of rootFolder as string
-			set folderList to folderList & {"Root Folder: " & rootName & " (ID: " & rootId & ")"}
+			set end of folderList to "Root Folder: " & rootName & " (ID: " & rootId & ")"
 			
 			-- Get level 2 subfolders
 			repeat with subFolder in folders of rootFolder
 				set subName to name of subFolder
 				set subId to id of subFolder as string
-				set folderList to folderList & {"  ├── Subfolder: " & subName & " (ID: " & subId & ")"}
+				set end of folderList to "  ├── Subfolder: " & subName & " (ID: " & subId & ")"
 				
 				-- Get level 3 subfolders
 				repeat with subSubFolder in folders of subFolder
 					set subSubName to name of subSubFolder
 					set subSubId to id of subSubFolder as string
-					set folderList to folderList & {"    ├── Sub-subfolder: " & subSubName & " (ID: " & subSubId & ")"}
+					set end of folderList to "    ├── Sub-subfolder: " & subSubName & " (ID: " & subSubId & ")"
 					
 					-- Get level 4 subfolders
 					repeat with subSubSubFolder in folders of subSubFolder
 						set subSubSubName to name of subSubSubFolder
 						set subSubSubId to id of subSubSubFolder as string
-						set folderList to folderList & {"      ├── Sub-sub-subfolder: " & subSubSubName & " (ID: " & subSubSubId & ")"}
+						set end of folderList to "      ├── Sub-sub-subfolder: " & subSubSubName & " (ID: " & subSubSubId & ")"
 						
 						-- Get level 5 subfolders
 						repeat with subSubSubSubFolder in folders of subSubSubFolder
 							set subSubSubName to name of subSubSubSubFolder
 							set subSubSubSubId to id of subSubSubSubFolder as string
-							set folderList to folderList & {"        ├── Sub-sub-sub-subfolder: " & subSubSubName & " (ID: " & subSubSubSubId & ")"}
+							set end of folderList to "        ├── Sub-sub-sub-subfolder: " & subSubSubName & " (ID: " & subSubSubSubId & ")"
 						end repeat
 					end repeat
 				end repeat
 			end repeat
 			
-			set folderList to folderList & {""}
+			set end of folderList to ""
 		end repeat
 		
 		-- Convert to string
@@ -1,5 +1,63 @@
-from .base_operations import BaseAppleScriptOperations
-from .note_id_utils import NoteIDUtils
+from .base_operations import (
+    FIELD_SEPARATOR,
+    BaseAppleScriptOperations,
+    parse_note_row,
+)
+
+# Returns "success:" and the US-separated name, id, folder, created and
+# modified of the most recently modified note. The body is left to
+# _BODY_SCRIPT, so the scan never marshals note content. The script is static,
+# so it is compiled once.
+_MOST_RECENT_QUERY = """
+        -- One Apple Event each for every note's date and ID
+        set modDates to modification date of every note of primaryAccount
+        if (count of modDates) is 0 then
+            return "error:No notes found in iCloud account"
+        end if
+        set noteIDs to id of every note of primaryAccount
+
+        -- Find the latest date in the local list; no per-note events
+        set latestIndex to 1
+        set latestDate to item 1 of modDates
+        repeat with i from 2 to count of modDates
+            set currentDate to item i of modDates
+            if currentDate > latestDate then
+                set latestIndex to i
+                set latestDate to currentDate
+            end if
+        end repeat
+
+        set latestNote to note id (item latestIndex of noteIDs) of primaryAccount
+
+        set noteName to name of latestNote as string
+        set noteID to id of latestNote as string
+        set noteFolder to "Notes"
+        try
+            set noteFolder to name of container of latestNote as string
+        on error
+            set noteFolder to "Notes"
+        end try
+        set creationDate to creation date of latestNote as string
+        set modDate to modification date of latestNote as string
+
+        -- Fields are separated by ASCII US
+        set AppleScript's text item delimiters to character id 31
+        set outputText to {noteName, noteID, noteFolder, creationDate, modDate} as string
+        set AppleScript's text item delimiters to ""
+        return "success:" & outputText
+"""
+_MOST_RECENT_SCRIPT = BaseAppleScriptOperations.with_cached_account(_MOST_RECENT_QUERY)
+
+# Returns "success:" and the body of the note whose full ID is argv item 1.
+_BODY_QUERY = """
+        try
+            set noteBody to body of note id (item 1 of argv) of primaryAccount as string
+        on error errMsg
+            return "error:" & errMsg
+        end try
+        return "success:" & noteBody
+"""
+_BODY_SCRIPT = BaseAppleScriptOperations.with_cached_account(_BODY_QUERY)
 
 
 class GetMostRecentNoteOperations(BaseAppleScriptOperations):
@@ -10,8 +68,9 @@ class GetMostRecentNoteOperations(BaseAppleScriptOperations):
         """Get the single most recently modified note across all folders.
 
         This is significantly faster than listing all notes and sorting because
-        it uses AppleScript's built-in sort via 'whose modification date' and
-        only fetches the top result.
+        the modification dates of every note arrive as one list in a single
+        Apple Event; the newest is found by scanning that plain list. The body
+        is fetched by a second script, for the winning note only.
 
         Returns:
             Dictionary with note_id, name, folder, creation_date,
@@ -20,47 +79,38 @@ class GetMostRecentNoteOperations(BaseAppleScriptOperations):
         Raises:
             RuntimeError: If AppleScript execution fails or no notes exist
         """
-        script = """
-        tell application "Notes"
-            try
-                set primaryAccount to account "iCloud"
-                set allNotes to every note of primaryAccount
-                if (count of allNotes) is 0 then
-                    return "error:No notes found in iCloud account"
-                end if
-
-                -- Find the note with the latest modification date
-                set latestNote to item 1 of allNotes
-                set latestDate to modification date of latestNote
-
-                repeat with currentNote in allNotes
-                    set currentDate to modification date of currentNote
-                    if currentDate > latestDate then
-                        set latestNote to currentNote
-                        set latestDate to currentDate
-                    end if
-                end repeat
-
-                set noteName to name of latestNote as string
-                set noteID to id of latestNote as string
-                set noteFolder to "Notes"
-                try
-                    set noteFolder to name of container of latestNote as string
-                on error
-                    set noteFolder to "Notes"
-                end try
-                set creationDate to creation date of latestNote as string
-                set modDate to modification date of latestNote as string
-                set noteBody to body of latestNote as string
-
-                return "success:" & noteName & "|||" & noteID & "|||" & noteFolder & "|||" & creationDate & "|||" & modDate & "|||" & noteBody
-            on error errMsg
-                return "error:iCloud account not available. Please enable iCloud Notes sync - " & errMsg
-            end try
-        end tell
+        full_id, note = await GetMostRecentNoteOperations._find_latest_metadata()
+        note["body"] = await GetMostRecentNoteOperations._fetch_body(full_id)
+        return note
+
+    @staticmethod
+    async def get_most_recent_note_metadata() -> dict[str, str]:
+        """Get the most recently modified note without fetching its body.
+
+        Returns:
+            Dictionary with note_id, name, folder, creation_date, and
+            modification_date of the most recently modified note.
+
+        Raises:
+            RuntimeError: If AppleScript execution fails or no notes exist
         """
+        _, note = await GetMostRecentNoteOperations._find_latest_metadata()
+        return note
 
-        result = await GetMostRecentNoteOperations.execute_applescript(script)
+    @staticmethod
+    async def _find_latest_metadata() -> tuple[str, dict[str, str]]:
+        """Find the most recently modified note.
+
+        Returns:
+            The note's full Core Data ID, needed to address it again, and its
+            metadata dictionary
+
+        Raises:
+            RuntimeError: If AppleScript execution fails or no notes exist
+        """
+        result = await GetMostRecentNoteOperations.execute_compiled_applescript(
+            _MOST_RECENT_SCRIPT
+        )
 
         if result.startswith("error:"):
             raise RuntimeError(f"Failed to get most recent note: {result[6:]}")
@@ -68,32 +118,40 @@ class GetMostRecentNoteOperations(BaseAppleScriptOperations):
         return GetMostRecentNoteOperations._parse_result(result)
 
     @staticmethod
-    def _parse_result(result: str) -> dict[str, str]:
-        """Parse the AppleScript result."""
+    async def _fetch_body(full_note_id: str) -> str:
+        """Fetch the body of a single note.
+
+        Args:
+            full_note_id: Full Core Data ID like "x-coredata://UUID/ICNote/p123"
+
+        Returns:
+            The note body
+
+        Raises:
+            RuntimeError: If AppleScript execution fails
+        """
+        result = await GetMostRecentNoteOperations.execute_compiled_applescript(
+            _BODY_SCRIPT, [full_note_id]
+        )
+
+        if not result.startswith("success:"):
+            message = result[6:] if result.startswith("error:") else result
+            raise RuntimeError(f"Failed to read most recent note body: {message}")
+
+        return result[8:]  # strip "success:"
+
+    @staticmethod
+    def _parse_result(result: str) -> tuple[str, dict[str, str]]:
+        """Parse the AppleScript result into the full ID and metadata."""
         if not result.startswith("success:"):
             raise RuntimeError(f"Unexpected result format: {result}")
 
         content = result[8:]  # strip "success:"
-        parts = content.split("|||", 5)  # max 6 parts; body may contain |||
-        if len(parts) < 6:
+        note = parse_note_row(content)
+        if note is None:
             raise RuntimeError(f"Incomplete result from AppleScript: {result}")
+        full_id = content.split(FIELD_SEPARATOR, 2)[1]
+        return full_id, note
 
-        note_name, full_id, folder, creation_date, mod_date, body = (
-            parts[0],
-            parts[1],
-            parts[2],
-            parts[3],
-            parts[4],
-            parts[5],
-        )
-
-        return {
-            "note_id": NoteIDUtils.extract_primary_key(full_id),
-            "name": note_name,
-            "folder": folder,
-            "creation_date": creation_date,
-            "modification_date": mod_date,
-            "body": body,
-        }
 
 # Made with Bob
@@ -1,6 +1,34 @@
 
-from .base_operations import BaseAppleScriptOperations
-from .note_id_utils import NoteIDUtils
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+from .base_operations import BaseAppleScriptOperations, parse_note_row
+
+# Lists every note of every folder as RS-separated records of US-separated
+# name, id, folder, created and modified. The script is static, so it is
+# compiled once and reused.
+_LIST_QUERY = """
+        -- Fields are separated by ASCII US, records by ASCII RS
+        set outputLines to {}
+        -- Each row is a list coerced to text, joined on the field separator
+        set AppleScript's text item delimiters to character id 31
+        repeat with currentFolder in folders of primaryAccount
+            set folderName to name of currentFolder
+            -- One Apple Event per property for the whole folder
+            set noteNames to name of every note of currentFolder
+            set noteIDs to id of every note of currentFolder
+            set creationDates to creation date of every note of currentFolder
+            set modDates to modification date of every note of currentFolder
+            repeat with i from 1 to count of noteNames
+                set end of outputLines to {item i of noteNames, item i of noteIDs, folderName, item i of creationDates, item i of modDates} as string
+            end repeat
+        end repeat
+        set AppleScript's text item delimiters to character id 30
+        set outputText to outputLines as string
+        set AppleScript's text item delimiters to ""
+        return outputText
+"""
+_LIST_SCRIPT = BaseAppleScriptOperations.with_cached_account(_LIST_QUERY)
 
 
 class ListNotesOperations(BaseAppleScriptOperations):
@@ -11,6 +39,9 @@ class ListNotesOperations(BaseAppleScriptOperations):
         """Get a list of all notes across all folders with their IDs, names,
         folder location, creation date, and modification date.
 
+        Each property is fetched for a whole folder in one Apple Event, so the
+        number of events grows with the folder count rather than the note count.
+
         Returns:
             List of dictionaries with note_id, name, folder, creation_date,
             and modification_date
@@ -18,76 +49,34 @@ class ListNotesOperations(BaseAppleScriptOperations):
         Raises:
             RuntimeError: If AppleScript execution fails
         """
-        script = """
-        tell application "Notes"
-            try
-                set outputLines to {}
-                set iCloudAccount to account "iCloud"
-                repeat with currentFolder in folders of iCloudAccount
-                    set folderName to name of currentFolder
-                    repeat with currentNote in notes of currentFolder
-                        set noteName to name of currentNote
-                        set noteID to id of currentNote as string
-                        set creationDate to creation date of currentNote as string
-                        set modDate to modification date of currentNote as string
-                        set outputLines to outputLines & {noteName & "|||" & noteID & "|||" & folderName & "|||" & creationDate & "|||" & modDate}
-                    end repeat
-                end repeat
-                set AppleScript's text item delimiters to return
-                set outputText to outputLines as string
-                set AppleScript's text item delimiters to ""
-                return outputText
-            on error errMsg
-                return "error:iCloud account not available. Please enable iCloud Notes sync - " & errMsg
-            end try
-        end tell
-        """
-
-        result = await ListNotesOperations.execute_applescript(script)
-
-        if result.startswith("error:"):
-            raise RuntimeError(f"Failed to list all notes: {result[6:]}")
-
-        return ListNotesOperations._parse_notes_list(result)
+        return [note async for note in ListNotesOperations.iter_all_notes()]
 
     @staticmethod
-    def _parse_notes_list(result: str) -> list[dict[str, str]]:
-        """Parse the AppleScript result into a list of note dictionaries.
+    async def iter_all_notes() -> AsyncIterator[dict[str, str]]:
+        """Yield every note across all folders as its record of output arrives.
 
-        Args:
-            result: Raw AppleScript result string, one note per line in format:
-                    "name|||full_id|||folder|||creation_date|||modification_date"
+        Records are parsed one at a time, so the full listing is never held as
+        a single string and callers can start on the first notes early.
 
-        Returns:
-            List of dictionaries with note_id, name, folder, creation_date,
+        Yields:
+            Dictionaries with note_id, name, folder, creation_date, and
             modification_date
-        """
-        if not result.strip():
-            return []
-
-        notes: list[dict[str, str]] = []
-        for line in result.strip().split("\r"):
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split("|||")
-            if len(parts) < 5:
-                continue
-            note_name, full_note_id, folder, creation_date, mod_date = (
-                parts[0],
-                parts[1],
-                parts[2],
-                parts[3],
-                parts[4],
-            )
-            notes.append(
-                {
-                    "note_id": NoteIDUtils.extract_primary_key(full_note_id),
-                    "name": note_name,
-                    "folder": folder,
-                    "creation_date": creation_date,
-                    "modification_date": mod_date,
-                }
-            )
 
-        return notes
+        Raises:
+            RuntimeError: If AppleScript execution fails
+        """
+        first = True
+        # Every note of a folder repeats its name; keep one string per folder
+        folder_names: dict[str, str] = {}
+        async with aclosing(
+            ListNotesOperations.iter_compiled_records(_LIST_SCRIPT)
+        ) as records:
+            async for record in records:
+                if first and record.startswith("error:"):
+                    raise RuntimeError(f"Failed to list all notes: {record[6:]}")
+                first = False
+                note = parse_note_row(record)
+                if note is not None:
+                    folder = note["folder"]
+                    note["folder"] = folder_names.setdefault(folder, folder)
+                    yield note
@@ -189,6 +189,7 @@ class MoveFolderOperations(BaseAppleScriptOperations):
         """
 
         result = await MoveFolderOperations.execute_applescript(script)
+        MoveFolderOperations._invalidate_caches()
 
         if result.startswith("error:"):
             raise RuntimeError(f"Failed to move folder: {result[6:]}")
@@ -305,6 +306,7 @@ class MoveFolderOperations(BaseAppleScriptOperations):
         """
 
         result = await MoveFolderOperations.execute_applescript(script)
+        MoveFolderOperations._invalidate_caches()
 
         if result.startswith("error:"):
             raise RuntimeError(f"Failed to move folder: {result[6:]}")
@@ -456,6 +458,7 @@ class MoveFolderOperations(BaseAppleScriptOperations):
         """
 
         result = await MoveFolderOperations.execute_applescript(script)
+        MoveFolderOperations._invalidate_caches()
 
         if result.startswith("error:"):
             error_msg = result[6:]
@@ -238,6 +238,7 @@ class MoveNoteOperations(BaseAppleScriptOperations):
         """
 
         result = await MoveNoteOperations.execute_applescript(script)
+        MoveNoteOperations._invalidate_caches()
 
         if result.startswith("error:"):
             error_msg = result[6:]
@@ -285,6 +286,7 @@ class MoveNoteOperations(BaseAppleScriptOperations):
         """
 
         result = await MoveNoteOperations.execute_applescript(script)
+        MoveNoteOperations._invalidate_caches()
 
         if result.startswith("error:"):
             raise RuntimeError(f"Failed to move note: {result[6:]}")
@@ -20,67 +20,67 @@ tell application "Notes"
 		repeat with rootFolder in folders of primaryAccount
 			set rootName to name of rootFolder
 			set rootId to id of rootFolder as string
-			set structureList to structureList & {"Root Folder: " & rootName & " (ID: " & rootId & ")"}
+			set end of structureList to "Root Folder: " & rootName & " (ID: " & rootId & ")"
 			
 			-- Get notes in root folder
 			repeat with theNote in notes of rootFolder
 				set noteName to name of theNote
-				set structureList to structureList & {"  ├── Note: " & noteName}
+				set end of structureList to "  ├── Note: " & noteName
 			end repeat
 			
 			-- Get level 2 subfolders and their contents
 			repeat with subFolder in folders of rootFolder
 				set subName to name of subFolder
 				set subId to id of subFolder as string
-				set structureList to structureList & {"  ├── Subfolder: " & subName & " (ID: " & subId & ")"}
+				set end of structureList to "  ├── Subfolder: " & subName & " (ID: " & subId & ")"
 				
 				-- Get notes in level 2 subfolder
 				repeat with theNote in notes of subFolder
 					set noteName to name of theNote
-					set structureList to structureList & {"    ├── Note: " & noteName}
+					set end of structureList to "    ├── Note: " & noteName
 				end repeat
 				
 				-- Get level 3 subfolders and their contents
 				repeat with subSubFolder in folders of subFolder
 					set subSubName to name of subSubFolder
 					set subSubId to id of subSubFolder as string
-					set structureList to structureList & {"    ├── Sub-subfolder: " & subSubName & " (ID: " & subSubId & ")"}
+					set end of structureList to "    ├── Sub-subfolder: " & subSubName & " (ID: " & subSubId & ")"
 					
 					-- Get notes in level 3 subfolder
 					repeat with theNote in notes of subSubFolder
 						set noteName to name of theNote
-						set structureList to structureList & {"      ├── Note: " & noteName}
+						set end of structureList to "      ├── Note: " & noteName
 					end repeat
 					
 					-- Get level 4 subfolders and their contents
 					repeat with subSubSubFolder in folders of subSubFolder
 						set subSubSubName to name of subSubSubFolder
 						set subSubSubId to id of subSubSubFolder as string
-						set structureList to structureList & {"      ├── Sub-sub-subfolder: " & subSubSubName & " (ID: " & subSubSubId & ")"}
+						set end of structureList to "      ├── Sub-sub-subfolder: " & subSubSubName & " (ID: " & subSubSubId & ")"
 						
 						-- Get notes in level 4 subfolder
 						repeat with theNote in notes of subSubSubFolder
 							set noteName to name of theNote
-							set structureList to structureList & {"        ├── Note: " & noteName}
+							set end of structureList to "        ├── Note: " & noteName
 						end repeat
 						
 						-- Get level 5 subfolders and their contents
 						repeat with subSubSubSubFolder in folders of subSubSubFolder
 							set subSubSubName to name of subSubSubSubFolder
 							set subSubSubSubId to id of subSubSubSubFolder as string
-							set structureList to structureList & {"        ├── Sub-sub-sub-subfolder: " & subSubSubName & " (ID: " & subSubSubSubId & ")"}
+							set end of structureList to "        ├── Sub-sub-sub-subfolder: " & subSubSubName & " (ID: " & subSubSubSubId & ")"
 							
 							-- Get notes in level 5 subfolder
 							repeat with theNote in notes of subSubSubSubFolder
 								set noteName to name of theNote
-								set structureList to structureList & {"          ├── Note: " & noteName}
+								set end of structureList to "          ├── Note: " & noteName
 							end repeat
 						end repeat
 					end repeat
 				end repeat
 			end repeat
 			
-			set structureList to structureList & {""}
+			set end of structureList to ""
 		end repeat
 		
 		-- Convert to string
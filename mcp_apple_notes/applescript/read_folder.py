@@ -99,19 +99,24 @@ class ReadFolderOperations(BaseAppleScriptOperations):
                     set end of folderNotes to noteInfo
                 end repeat
                 
-                -- Build result string
-                set resultString to "success:" & actualFolderName & "|||" & folderId & "|||Unknown|||Unknown|||" & childFolderCount & "|||" & noteCount
+                -- Collect result fields in a list and join them once at the end
+                set resultParts to {{"success:" & actualFolderName, folderId as string, "Unknown", "Unknown", childFolderCount as string, noteCount as string}}
                 
                 -- Add child folders info
                 repeat with childFolderInfo in childFolders
-                    set resultString to resultString & "|||" & item 1 of childFolderInfo & "|||" & item 2 of childFolderInfo
+                    set end of resultParts to item 1 of childFolderInfo as string
+                    set end of resultParts to item 2 of childFolderInfo as string
                 end repeat
                 
                 -- Add notes info
                 repeat with noteInfo in folderNotes
-                    set resultString to resultString & "|||" & item 1 of noteInfo & "|||" & item 2 of noteInfo
+                    set end of resultParts to item 1 of noteInfo as string
+                    set end of resultParts to item 2 of noteInfo as string
                 end repeat
                 
+                set AppleScript's text item delimiters to "|||"
+                set resultString to resultParts as string
+                set AppleScript's text item delimiters to ""
                 return resultString
             on error errMsg
                 return "error:iCloud account not available. Please enable iCloud Notes sync - " & errMsg
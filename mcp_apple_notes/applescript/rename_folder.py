@@ -225,6 +225,7 @@ class RenameFolderOperations(BaseAppleScriptOperations):
         """
 
         result = await RenameFolderOperations.execute_applescript(script)
+        RenameFolderOperations._invalidate_caches()
 
         if result.startswith("error:"):
             error_msg = result[6:]
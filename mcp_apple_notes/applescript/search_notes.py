@@ -1,5 +1,50 @@
-from .base_operations import BaseAppleScriptOperations
-from .note_id_utils import NoteIDUtils
+import asyncio
+from collections.abc import AsyncIterator
+
+from .base_operations import RECORD_SEPARATOR, BaseAppleScriptOperations, parse_row
+
+# Column order of the rows returned by the search script.
+_SEARCH_ROW_FIELDS = ("name", "note_id", "folder", "matched_keyword")
+
+# Finds notes whose title or body contains argv item 1, returning at most argv
+# item 2 RS-separated records of US-separated name, id, container id and
+# keyword. The keyword arrives as an argument, so it needs no escaping and the
+# script compiles once.
+_SEARCH_QUERY = """
+        set kwStr to item 1 of argv
+        set maxResults to (item 2 of argv) as integer
+        set matchingNotes to a reference to (every note of primaryAccount whose name contains kwStr or body contains kwStr)
+
+        -- IDs come first so a keyword without matches costs one event
+        set noteIDs to id of matchingNotes
+        set matchCount to count of noteIDs
+        if matchCount is 0 then return ""
+        if matchCount > maxResults then set matchCount to maxResults
+        set noteNames to name of matchingNotes
+        -- Folder names are resolved from the cached folder map in Python
+        try
+            set containerIDs to id of container of matchingNotes
+        on error
+            set containerIDs to {}
+        end try
+        set haveContainers to (count of containerIDs) is (count of noteIDs)
+
+        -- Fields are separated by ASCII US, records by ASCII RS
+        set outputLines to {}
+        -- Each row is a list coerced to text, joined on the field separator
+        set AppleScript's text item delimiters to character id 31
+        repeat with i from 1 to matchCount
+            set containerID to ""
+            if haveContainers then set containerID to item i of containerIDs as string
+            set end of outputLines to {item i of noteNames, item i of noteIDs, containerID, kwStr} as string
+        end repeat
+
+        set AppleScript's text item delimiters to character id 30
+        set outputText to outputLines as string
+        set AppleScript's text item delimiters to ""
+        return outputText
+"""
+_SEARCH_SCRIPT = BaseAppleScriptOperations.with_cached_account(_SEARCH_QUERY)
 
 
 class SearchNotesOperations(BaseAppleScriptOperations):
@@ -11,13 +56,14 @@ class SearchNotesOperations(BaseAppleScriptOperations):
     ) -> list[dict[str, str]]:
         """Search for notes where any keyword appears in the title OR body.
 
-        Uses a two-phase strategy for performance:
-        1. Fast title search using native 'whose' filtering
-        2. Selective body search with result limiting
+        Each keyword is one native 'whose name contains ... or body contains
+        ...' query, so Notes filters in its own store and note bodies are never
+        sent back over Apple Events. Only names, IDs and container IDs of the
+        matches are fetched, each as a single list. Notes matching several
+        keywords are reported once, under the first keyword that found them.
 
-        Uses a safe ||| delimiter in AppleScript output to avoid the
-        comma-splitting bug that broke results for notes/folders containing
-        commas.
+        Rows use the ASCII record and field separators, which cannot occur
+        in note names, so no title can be mistaken for a delimiter.
 
         Args:
             keywords: List of keywords to search for
@@ -26,197 +72,85 @@ class SearchNotesOperations(BaseAppleScriptOperations):
         Returns:
             List of dictionaries with note_id, name, folder, and matched_keyword
         """
-        if not keywords:
-            return []
-
-        # Escape each keyword for AppleScript string literals
-        escaped_keywords = [
-            kw.replace("\\", "\\\\").replace('"', '\\"') for kw in keywords
+        return [
+            note
+            async for note in SearchNotesOperations.iter_search_notes(
+                keywords, max_results
+            )
         ]
-        keywords_str = ", ".join([f'"{kw}"' for kw in escaped_keywords])
-
-        # Build the AppleScript command with two-phase search strategy
-        # Phase 1: Fast title search using native filtering
-        # Phase 2: Selective body search (only if needed and time permits)
-        script = f"""
-        tell application "Notes"
-            try
-                set primaryAccount to account "iCloud"
-                set keywords to {{{keywords_str}}}
-                set maxResults to {max_results}
-                set outputLines to {{}}
-                set resultCount to 0
-                
-                -- PHASE 1: Fast title search using native filtering
-                -- This is FAST because AppleScript filters server-side
-                set titleMatchedNotes to {{}}
-                repeat with kw in keywords
-                    set kwStr to kw as string
-                    try
-                        set matches to (every note of primaryAccount whose name contains kwStr)
-                        repeat with matchedNote in matches
-                            -- Check if we already have this note (deduplication)
-                            set noteID to id of matchedNote as string
-                            set alreadyAdded to false
-                            repeat with existingNote in titleMatchedNotes
-                                if id of existingNote as string is noteID then
-                                    set alreadyAdded to true
-                                    exit repeat
-                                end if
-                            end repeat
-                            
-                            if not alreadyAdded then
-                                set end of titleMatchedNotes to matchedNote
-                            end if
-                        end repeat
-                    on error
-                        -- Continue if filtering fails for this keyword
-                    end try
-                end repeat
-                
-                -- Add title matches to output
-                repeat with matchedNote in titleMatchedNotes
-                    if resultCount >= maxResults then
-                        exit repeat
-                    end if
-                    
-                    set noteName to name of matchedNote as string
-                    set noteID to id of matchedNote as string
-                    
-                    -- Get the folder name
-                    set noteFolder to "Notes"
-                    try
-                        set noteFolder to name of container of matchedNote as string
-                    on error
-                        set noteFolder to "Notes"
-                    end try
-                    
-                    -- Find which keyword matched
-                    set matchedKeyword to ""
-                    repeat with kw in keywords
-                        set kwStr to kw as string
-                        if noteName contains kwStr then
-                            set matchedKeyword to kwStr
-                            exit repeat
-                        end if
-                    end repeat
-                    
-                    set outputLines to outputLines & {{noteName & "|||" & noteID & "|||" & noteFolder & "|||" & matchedKeyword}}
-                    set resultCount to resultCount + 1
-                end repeat
-                
-                -- PHASE 2: Body search (only if we haven't hit max_results)
-                -- Only search bodies of notes NOT already matched by title
-                if resultCount < maxResults then
-                    set remainingSlots to maxResults - resultCount
-                    set allNotes to every note of primaryAccount
-                    set bodySearchCount to 0
-                    
-                    repeat with currentNote in allNotes
-                        if bodySearchCount >= remainingSlots then
-                            exit repeat
-                        end if
-                        
-                        -- Skip if already in title matches
-                        set noteID to id of currentNote as string
-                        set alreadyMatched to false
-                        repeat with titleNote in titleMatchedNotes
-                            if id of titleNote as string is noteID then
-                                set alreadyMatched to true
-                                exit repeat
-                            end if
-                        end repeat
-                        
-                        if not alreadyMatched then
-                            -- Only NOW do we fetch the body (expensive operation)
-                            set noteBody to body of currentNote as string
-                            set noteName to name of currentNote as string
-                            
-                            -- Check if any keyword matches body
-                            set foundKeyword to ""
-                            repeat with kw in keywords
-                                set kwStr to kw as string
-                                if noteBody contains kwStr then
-                                    set foundKeyword to kwStr
-                                    exit repeat
-                                end if
-                            end repeat
-                            
-                            if foundKeyword is not "" then
-                                -- Get the folder name
-                                set noteFolder to "Notes"
-                                try
-                                    set noteFolder to name of container of currentNote as string
-                                on error
-                                    set noteFolder to "Notes"
-                                end try
-                                
-                                set outputLines to outputLines & {{noteName & "|||" & noteID & "|||" & noteFolder & "|||" & foundKeyword}}
-                                set bodySearchCount to bodySearchCount + 1
-                                set resultCount to resultCount + 1
-                            end if
-                        end if
-                    end repeat
-                end if
-                
-                set AppleScript's text item delimiters to return
-                set outputText to outputLines as string
-                set AppleScript's text item delimiters to ""
-                return outputText
-            on error errMsg
-                return "error:iCloud account not available. Please enable iCloud Notes sync - " & errMsg
-            end try
-        end tell
-        """
 
-        # Use shorter timeout for search operations
-        result = await SearchNotesOperations.execute_applescript(script, timeout=30)
+    @staticmethod
+    async def iter_search_notes(
+        keywords: list[str], max_results: int = 50
+    ) -> AsyncIterator[dict[str, str]]:
+        """Yield search_notes results, merged across keywords.
 
-        if result.startswith("error:"):
-            raise RuntimeError(f"Failed to search notes: {result[6:]}")
+        The per-keyword queries are independent, so they run concurrently;
+        on the persistent worker they are sent as a single batch. Results are
+        then merged in keyword order, so a note matching several keywords is
+        still reported under the first of them.
 
-        return SearchNotesOperations._parse_search_results(result)
+        Args:
+            keywords: List of keywords to search for
+            max_results: Maximum number of results to yield (default 50)
 
-    @staticmethod
-    def _parse_search_results(result: str) -> list[dict[str, str]]:
-        """Parse AppleScript result into list of search result dictionaries.
+        Yields:
+            Dictionaries with note_id, name, folder, and matched_keyword
 
-        Each line of the result is in the format:
-            noteName|||noteID|||noteFolder|||matchedKeyword
+        Raises:
+            RuntimeError: If AppleScript execution fails
+        """
+        if max_results <= 0 or not keywords:
+            return
+        # Use shorter timeout for search operations
+        results = await asyncio.gather(
+            *(
+                SearchNotesOperations.execute_compiled_applescript(
+                    _SEARCH_SCRIPT, [keyword, str(max_results)], timeout=30
+                )
+                for keyword in keywords
+            ),
+            # Let every run finish before reporting a failure, so none is
+            # left running with its outcome unobserved.
+            return_exceptions=True,
+        )
+        outputs: list[str] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            outputs.append(result)
+
+        seen: set[str] = set()
+        folder_map: dict[str, str] | None = None
+        for keyword, output in zip(keywords, outputs, strict=True):
+            if output.startswith("error:"):
+                raise RuntimeError(f"Failed to search notes: {output[6:]}")
+            for record in output.split(RECORD_SEPARATOR):
+                note = SearchNotesOperations._parse_search_record(record)
+                if note is None or note["note_id"] in seen:
+                    continue
+                seen.add(note["note_id"])
+                # Share the caller's keyword string instead of one copy per row
+                note["matched_keyword"] = keyword
+                if folder_map is None:
+                    folder_map = await SearchNotesOperations._fetch_folder_map()
+                note["folder"] = folder_map.get(note["folder"], "Notes")
+                yield note
+                if len(seen) >= max_results:
+                    return
+
+    @staticmethod
+    def _parse_search_record(record: str) -> dict[str, str] | None:
+        """Parse one record of search output into a search result dictionary.
 
         Args:
-            result: Raw AppleScript result (newline-separated lines)
+            record: US-separated noteName, noteID, containerID, matchedKeyword
 
         Returns:
-            List of dictionaries with note_id, name, folder, and matched_keyword
+            Dictionary with note_id, name, folder, and matched_keyword, or None
+            if the record is incomplete
         """
-        notes: list[dict[str, str]] = []
-
-        if not result or not result.strip():
-            return notes
-
-        for line in result.strip().split("\r"):
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split("|||")
-            if len(parts) < 4:
-                continue
-            note_name, full_note_id, folder_name, matched_keyword = (
-                parts[0],
-                parts[1],
-                parts[2],
-                parts[3],
-            )
-            short_id = NoteIDUtils.extract_primary_key(full_note_id)
-            if short_id and note_name:
-                notes.append(
-                    {
-                        "note_id": short_id,
-                        "name": note_name,
-                        "folder": folder_name,
-                        "matched_keyword": matched_keyword,
-                    }
-                )
-
-        return notes
+        note = parse_row(record, _SEARCH_ROW_FIELDS)
+        if note is None or not note["note_id"] or not note["name"]:
+            return None
+        return note
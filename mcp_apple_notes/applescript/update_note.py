@@ -96,6 +96,7 @@ class UpdateNoteOperations(BaseAppleScriptOperations):
         """
 
         result = await UpdateNoteOperations.execute_applescript(script)
+        UpdateNoteOperations._invalidate_caches()
 
         if result.startswith("error:"):
             error_msg = result[6:]
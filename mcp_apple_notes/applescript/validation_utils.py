@@ -1,6 +1,10 @@
 
 from .base_operations import BaseAppleScriptOperations
 
+# Escapes for an AppleScript string literal, built once and applied in a
+# single translate pass.
+_AS_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 class ValidationUtils(BaseAppleScriptOperations):
     """Centralized validation utilities for Apple Notes operations."""
@@ -379,7 +383,7 @@ class ValidationUtils(BaseAppleScriptOperations):
             return '""'
 
         # Escape the text for AppleScript string literals
-        escaped_text = text.replace("\\", "\\\\").replace('"', '\\"')
+        escaped_text = text.translate(_AS_ESCAPE)
         return f'"{escaped_text}"'
 
     @staticmethod
@@ -1,12 +1,28 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 
-from mcp_apple_notes.applescript import ValidationUtils
+from mcp_apple_notes.applescript import BaseAppleScriptOperations, ValidationUtils
 from mcp_apple_notes.tools import NotesTools
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Run the persistent osascript worker for the lifetime of the server.
+
+    Starting it here moves process start-up out of the first tool call.
+    """
+    await BaseAppleScriptOperations.start_worker()
+    try:
+        yield
+    finally:
+        await BaseAppleScriptOperations.stop_worker()
+
+
 # Initialize FastMCP server
-mcp = FastMCP(name="mcp-apple-notes")
+mcp = FastMCP(name="mcp-apple-notes", lifespan=lifespan)
 
 # Initialize tools
 notes_tools = NotesTools()
@@ -669,6 +685,40 @@ async def get_most_recent_note(ctx: Context) -> str:
         raise
 
 
+@mcp.tool()
+async def get_most_recent_note_metadata(ctx: Context) -> str:
+    """Get the most recently modified note's details without its content.
+
+    Same scan as get_most_recent_note, but the note body is never fetched,
+    so this is the cheaper choice when only the note's identity is needed.
+
+    Output:
+    - Note name, ID, folder, creation date, modification date
+
+    Returns:
+        The most recently modified note's details
+    """
+    try:
+        note = await notes_tools.get_most_recent_note_metadata()
+
+        result = "Most Recently Modified Note:\n\n"
+        result += f"Name: {note.get('name', 'N/A')}\n"
+        result += f"ID: {note.get('note_id', 'N/A')}\n"
+        result += f"Folder: {note.get('folder', 'N/A')}\n"
+        result += f"Created: {note.get('creation_date', 'N/A')}\n"
+        result += f"Modified: {note.get('modification_date', 'N/A')}\n"
+
+        return result
+
+    except TimeoutError as e:
+        error_msg = str(e)
+        await ctx.error(error_msg)
+        raise RuntimeError(error_msg)
+    except Exception as e:
+        await ctx.error(f"Error getting most recent note metadata: {str(e)}")
+        raise
+
+
 @mcp.tool()
 async def find_notes_by_title(
     ctx: Context,
@@ -869,19 +919,20 @@ async def search_notes(
     - Searches through all notes in Apple Notes
     - Matches keywords against both note title AND body content
     - Case-insensitive search
-    - Two-phase search strategy: fast title search first, then selective body search
+    - One native "name contains keyword or body contains keyword" query per keyword
     - Result limiting to prevent timeouts (default 50 results)
     - Returns note details with the matched keyword
 
     Performance:
-    - Title matches are found quickly using native filtering
-    - Body search is selective and limited to prevent timeouts
+    - Notes filters titles and bodies in its own store; bodies are never fetched
+    - Keyword queries run concurrently, each capped at max_results matches
     - Optimized for large note libraries (500-1000+ notes)
 
     Output Format:
     - Numbered list of matching notes
     - Note names, IDs, folder locations, and matched keyword
-    - Title matches appear first, followed by body matches
+    - Results are grouped in keyword order; a note matching several keywords
+      is listed once, under the first of them
     """
     try:
         # Parse keywords from comma-separated string
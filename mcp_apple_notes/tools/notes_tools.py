@@ -131,3 +131,7 @@ class NotesTools:
     async def get_most_recent_note(self) -> dict[str, str]:
         """Get the single most recently modified note with its full content."""
         return await GetMostRecentNoteOperations.get_most_recent_note()
+
+    async def get_most_recent_note_metadata(self) -> dict[str, str]:
+        """Get the most recently modified note's metadata, without its body."""
+        return await GetMostRecentNoteOperations.get_most_recent_note_metadata()
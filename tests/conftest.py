@@ -0,0 +1,62 @@
+"""Shared fixtures for running operations against a fake osascript."""
+
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+from mcp_apple_notes.applescript import base_operations
+from mcp_apple_notes.applescript.base_operations import (
+    BaseAppleScriptOperations,
+    _WorkerPool,
+)
+
+# Worker side of the framed JSON protocol; the test supplies handle(request).
+_WORKER_LOOP = """
+import json
+import sys
+
+EOF = "\\x04EOF\\x04\\n"
+print(json.dumps({"ready": True}), flush=True)
+buffer = ""
+for chunk in iter(sys.stdin.readline, ""):
+    buffer += chunk
+    while EOF in buffer:
+        request, buffer = buffer.split(EOF, 1)
+        print(json.dumps(handle(json.loads(request))), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_osascript(tmp_path, monkeypatch):
+    """Install a Python program as `osascript` on PATH.
+
+    Returns a function taking the program's source, and optionally another
+    command name to install it as (e.g. "osacompile"). A fresh worker pool and
+    an empty compiled-script directory are used, so nothing leaks between
+    tests; without osacompile on PATH, templates run as `-e` source.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(base_operations, "COMPILED_SCRIPT_DIR", tmp_path / "cache")
+    monkeypatch.setattr(BaseAppleScriptOperations, "_worker_pool", _WorkerPool())
+
+    def install(source: str, name: str = "osascript") -> None:
+        path = bin_dir / name
+        path.write_text(f"#!{sys.executable}\n{textwrap.dedent(source)}")
+        path.chmod(path.stat().st_mode | stat.S_IEXEC)
+
+    return install
+
+
+@pytest.fixture
+def fake_worker(fake_osascript):
+    """Install a fake worker; takes source defining handle(request)."""
+
+    def install(handler_source: str) -> None:
+        fake_osascript(textwrap.dedent(handler_source) + _WORKER_LOOP)
+
+    return install
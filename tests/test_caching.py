@@ -0,0 +1,50 @@
+"""Tests for read-side result caching."""
+
+import asyncio
+
+from mcp_apple_notes.applescript import find_notes_by_date
+from mcp_apple_notes.applescript.base_operations import BaseAppleScriptOperations
+from mcp_apple_notes.applescript.find_notes_by_date import FindNotesByDateOperations
+
+
+def _count_script_runs(monkeypatch) -> list[int]:
+    """Replace AppleScript execution with a stub and count its calls."""
+    calls = [0]
+
+    async def fake_iter_records(script, args=(), timeout=60):
+        calls[0] += 1
+        return
+        yield
+
+    monkeypatch.setattr(
+        FindNotesByDateOperations,
+        "iter_compiled_records",
+        staticmethod(fake_iter_records),
+    )
+    find_notes_by_date._QUERY_CACHE.clear()
+    return calls
+
+
+def test_find_notes_by_date_reuses_cached_result(monkeypatch):
+    """Test that repeating a date query does not run AppleScript again."""
+    calls = _count_script_runs(monkeypatch)
+
+    async def run_twice():
+        await FindNotesByDateOperations.find_notes_by_date("modified", "2024-01-01")
+        await FindNotesByDateOperations.find_notes_by_date("modified", "2024-01-01")
+
+    asyncio.run(run_twice())
+    assert calls[0] == 1
+
+
+def test_invalidate_caches_forces_fresh_query(monkeypatch):
+    """Test that a write operation's invalidation clears cached results."""
+    calls = _count_script_runs(monkeypatch)
+
+    async def run_with_write_between():
+        await FindNotesByDateOperations.find_notes_by_date("created", "2024-01-01")
+        BaseAppleScriptOperations._invalidate_caches()
+        await FindNotesByDateOperations.find_notes_by_date("created", "2024-01-01")
+
+    asyncio.run(run_with_write_between())
+    assert calls[0] == 2
@@ -0,0 +1,38 @@
+"""Tests for the osacompile cache used by the one-shot path."""
+
+import asyncio
+from pathlib import Path
+
+from mcp_apple_notes.applescript import base_operations
+from mcp_apple_notes.applescript.base_operations import BaseAppleScriptOperations
+
+# Writes stdin to the -o path in two halves, so an overlapping writer would
+# leave a mixed file behind.
+_SLOW_OSACOMPILE = """
+import sys
+import time
+
+source = sys.stdin.read()
+with open(sys.argv[2], "w") as out:
+    out.write(source[: len(source) // 2])
+    out.flush()
+    time.sleep(0.2)
+    out.write(source[len(source) // 2 :])
+"""
+
+
+def test_concurrent_compiles_all_get_the_cached_path(fake_osascript):
+    """Test that concurrent compiles of one script all succeed intact."""
+    fake_osascript(_SLOW_OSACOMPILE, name="osacompile")
+    script = "on run argv\n    return item 1 of argv\nend run\n"
+
+    async def compile_four():
+        return await asyncio.gather(
+            *(BaseAppleScriptOperations._compile_script(script) for _ in range(4))
+        )
+
+    paths = asyncio.run(compile_four())
+    cache_dir = base_operations.COMPILED_SCRIPT_DIR
+    assert len(set(paths)) == 1 and paths[0] is not None
+    assert Path(paths[0]).read_text() == script
+    assert list(cache_dir.iterdir()) == [Path(paths[0])]
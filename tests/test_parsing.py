@@ -0,0 +1,233 @@
+"""Tests for parsing AppleScript output into note dictionaries."""
+
+import asyncio
+
+import pytest
+
+from mcp_apple_notes.applescript.base_operations import (
+    FIELD_SEPARATOR,
+    NOTE_ROW_FIELDS,
+    RECORD_SEPARATOR,
+    BaseAppleScriptOperations,
+    parse_note_row,
+    parse_row,
+    parse_rows,
+)
+
+
+def _rows(*records: tuple[str, ...]) -> str:
+    """Build RS/US-delimited script output from field tuples."""
+    return RECORD_SEPARATOR.join(FIELD_SEPARATOR.join(r) for r in records)
+
+
+def test_parse_rows():
+    """Test that rows are split into fields and note IDs are shortened."""
+    result = _rows(
+        ("Groceries", "x-coredata://ABC/ICNote/p12", "Home", "Mon 1", "Tue 2"),
+        ("Plan", "x-coredata://ABC/ICNote/p34", "Work", "Wed 3", "Thu 4"),
+    )
+    notes = parse_rows(result, NOTE_ROW_FIELDS)
+    assert notes == [
+        {
+            "name": "Groceries",
+            "note_id": "p12",
+            "folder": "Home",
+            "creation_date": "Mon 1",
+            "modification_date": "Tue 2",
+        },
+        {
+            "name": "Plan",
+            "note_id": "p34",
+            "folder": "Work",
+            "creation_date": "Wed 3",
+            "modification_date": "Thu 4",
+        },
+    ]
+
+
+def test_parse_rows_keeps_punctuation_in_values():
+    """Test that commas, pipes and newlines inside values survive parsing."""
+    result = _rows(("A, B ||| C\nD", "p1", "Work, Home", "c", "m"))
+    notes = parse_rows(result, NOTE_ROW_FIELDS)
+    assert notes[0]["name"] == "A, B ||| C\nD"
+    assert notes[0]["folder"] == "Work, Home"
+
+
+def test_parse_rows_skips_short_and_empty_records():
+    """Test that blank and incomplete records are ignored."""
+    result = _rows(("only", "three", "fields"), ("A", "p1", "Notes", "c", "m"))
+    result = RECORD_SEPARATOR + result + RECORD_SEPARATOR
+    notes = parse_rows(result, NOTE_ROW_FIELDS)
+    assert [note["name"] for note in notes] == ["A"]
+
+
+def test_parse_rows_empty_result():
+    """Test that empty output yields no notes."""
+    assert parse_rows("", NOTE_ROW_FIELDS) == []
+
+
+def test_parse_row():
+    """Test that a single streamed record parses like a full result."""
+    record = FIELD_SEPARATOR.join(("A", "x-coredata://ABC/ICNote/p9", "f", "c", "m"))
+    assert parse_row(record, NOTE_ROW_FIELDS)["note_id"] == "p9"
+    assert parse_row("too" + FIELD_SEPARATOR + "short", NOTE_ROW_FIELDS) is None
+
+
+def test_parse_note_row_matches_parse_row():
+    """Test that the fixed-arity note parser agrees with the generic one."""
+    record = FIELD_SEPARATOR.join(("A", "x-coredata://ABC/ICNote/p9", "f", "c", "m"))
+    assert parse_note_row(record) == parse_row(record, NOTE_ROW_FIELDS)
+    assert parse_note_row("too" + FIELD_SEPARATOR + "short") is None
+
+
+def test_resolve_folder_names(monkeypatch):
+    """Test that container IDs are mapped to folder names with a fallback."""
+
+    async def fake_folder_map():
+        return {"x-coredata://ABC/ICFolder/p2": "Work"}
+
+    monkeypatch.setattr(
+        BaseAppleScriptOperations,
+        "_fetch_folder_map",
+        staticmethod(fake_folder_map),
+    )
+    notes = [{"folder": "x-coredata://ABC/ICFolder/p2"}, {"folder": ""}]
+    asyncio.run(BaseAppleScriptOperations._resolve_folder_names(notes))
+    assert [note["folder"] for note in notes] == ["Work", "Notes"]
+
+
+def _fake_records(monkeypatch, cls, outputs):
+    """Serve each script run from the next output string."""
+    remaining = list(outputs)
+
+    async def fake_iter_records(
+        script, args=(), timeout=60, separator=RECORD_SEPARATOR
+    ):
+        for record in remaining.pop(0).split(separator):
+            if record:
+                yield record
+
+    async def fake_execute(script, args=(), timeout=60):
+        return remaining.pop(0)
+
+    async def fake_folder_map():
+        return {"f1": "Work"}
+
+    monkeypatch.setattr(cls, "iter_compiled_records", staticmethod(fake_iter_records))
+    monkeypatch.setattr(cls, "execute_compiled_applescript", staticmethod(fake_execute))
+    monkeypatch.setattr(cls, "_fetch_folder_map", staticmethod(fake_folder_map))
+
+
+def test_search_notes_keeps_first_match_per_note(monkeypatch):
+    """Test that a note found by several keywords is reported once."""
+    from mcp_apple_notes.applescript.search_notes import SearchNotesOperations
+
+    _fake_records(
+        monkeypatch,
+        SearchNotesOperations,
+        [
+            _rows(("Plan", "x-coredata://ABC/ICNote/p1", "f1", "trip")),
+            _rows(
+                ("Plan", "x-coredata://ABC/ICNote/p1", "f1", "budget"),
+                ("Costs", "x-coredata://ABC/ICNote/p2", "f1", "budget"),
+            ),
+        ],
+    )
+    notes = asyncio.run(SearchNotesOperations.search_notes(["trip", "budget"]))
+    assert [(n["note_id"], n["matched_keyword"], n["folder"]) for n in notes] == [
+        ("p1", "trip", "Work"),
+        ("p2", "budget", "Work"),
+    ]
+
+
+def test_search_notes_waits_for_every_keyword_before_failing(monkeypatch):
+    """Test that one failing keyword is reported after the others finish."""
+    from mcp_apple_notes.applescript.search_notes import SearchNotesOperations
+
+    finished = []
+
+    async def fake_execute(script, args=(), timeout=60):
+        if args[0] == "bad":
+            raise RuntimeError("AppleScript error: boom")
+        await asyncio.sleep(0.05)
+        finished.append(args[0])
+        return ""
+
+    monkeypatch.setattr(
+        SearchNotesOperations,
+        "execute_compiled_applescript",
+        staticmethod(fake_execute),
+    )
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(SearchNotesOperations.search_notes(["bad", "good"]))
+    assert finished == ["good"]
+
+
+def test_list_all_notes_skips_incomplete_records(monkeypatch):
+    """Test that list output parses per record and ignores short rows."""
+    from mcp_apple_notes.applescript.list_notes import ListNotesOperations
+
+    result = _rows(
+        ("A", "x-coredata://ABC/ICNote/p1", "Work", "c", "m"),
+        ("",),
+        ("broken", "p2"),
+        ("B", "p3", "Home", "c", "m"),
+    )
+    _fake_records(monkeypatch, ListNotesOperations, [result])
+    notes = asyncio.run(ListNotesOperations.list_all_notes())
+    assert [(n["name"], n["note_id"], n["folder"]) for n in notes] == [
+        ("A", "p1", "Work"),
+        ("B", "p3", "Home"),
+    ]
+
+
+def test_most_recent_note_fetches_body_of_winner(monkeypatch):
+    """Test that the body is read in a second call, by the winner's full ID."""
+    from mcp_apple_notes.applescript.get_most_recent_note import (
+        GetMostRecentNoteOperations,
+    )
+
+    body = "a ||| b" + FIELD_SEPARATOR + "c"
+    calls = []
+    outputs = [
+        "success:" + _rows(("Plan", "x-coredata://ABC/ICNote/p7", "Work", "c", "m")),
+        "success:" + body,
+    ]
+
+    async def fake_execute(script, args=(), timeout=60):
+        calls.append(list(args))
+        return outputs.pop(0)
+
+    monkeypatch.setattr(
+        GetMostRecentNoteOperations,
+        "execute_compiled_applescript",
+        staticmethod(fake_execute),
+    )
+    note = asyncio.run(GetMostRecentNoteOperations.get_most_recent_note())
+    assert note["note_id"] == "p7"
+    assert note["body"] == body
+    assert calls == [[], ["x-coredata://ABC/ICNote/p7"]]
+
+
+def test_most_recent_note_metadata_skips_body(monkeypatch):
+    """Test that the metadata variant makes no body fetch."""
+    from mcp_apple_notes.applescript.get_most_recent_note import (
+        GetMostRecentNoteOperations,
+    )
+
+    calls = []
+
+    async def fake_execute(script, args=(), timeout=60):
+        calls.append(list(args))
+        row = ("Plan", "x-coredata://ABC/ICNote/p7", "Work", "c", "m")
+        return "success:" + _rows(row)
+
+    monkeypatch.setattr(
+        GetMostRecentNoteOperations,
+        "execute_compiled_applescript",
+        staticmethod(fake_execute),
+    )
+    note = asyncio.run(GetMostRecentNoteOperations.get_most_recent_note_metadata())
+    assert note["note_id"] == "p7"
+    assert "body" not in note
+    assert calls == [[]]
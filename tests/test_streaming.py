@@ -0,0 +1,68 @@
+"""Tests for streaming one-shot osascript output record by record."""
+
+import asyncio
+import time
+
+import pytest
+
+from mcp_apple_notes.applescript.base_operations import BaseAppleScriptOperations
+
+# Fails to start as a worker, so calls take the one-shot path. As a one-shot
+# run it prints RS-separated records, pausing between them, and hangs before
+# the last one if argv item 1 is "hang".
+_STREAMING_OSASCRIPT = """
+import sys
+import time
+
+if "-l" in sys.argv:
+    sys.exit(1)
+args = sys.argv[sys.argv.index("-e") + 2 :]
+for record in ("a", "b"):
+    sys.stdout.write(record + "\\x1e")
+    sys.stdout.flush()
+    time.sleep(0.05)
+if args and args[0] == "hang":
+    time.sleep(30)
+if args and args[0] == "fail":
+    sys.stderr.write("execution error: Notes got an error (-1728)")
+    sys.exit(1)
+sys.stdout.write("c\\n")
+"""
+
+
+def _collect(args, records, timeout=10):
+    """Run the template through iter_compiled_records, appending records."""
+
+    async def run():
+        async for record in BaseAppleScriptOperations.iter_compiled_records(
+            "on run argv", args, timeout=timeout
+        ):
+            records.append(record)
+
+    asyncio.run(run())
+
+
+def test_records_stream_including_trailing_partial(fake_osascript):
+    """Test that every record arrives, including the last unterminated one."""
+    fake_osascript(_STREAMING_OSASCRIPT)
+    records = []
+    _collect(["ok"], records)
+    assert records == ["a", "b", "c"]
+
+
+def test_deadline_covers_the_whole_run(fake_osascript):
+    """Test that a stalled run times out after the records it did send."""
+    fake_osascript(_STREAMING_OSASCRIPT)
+    records = []
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        _collect(["hang"], records, timeout=1)
+    assert records == ["a", "b"]
+    assert time.monotonic() - started < 10
+
+
+def test_failed_run_raises_with_stderr(fake_osascript):
+    """Test that a non-zero exit surfaces osascript's error message."""
+    fake_osascript(_STREAMING_OSASCRIPT)
+    with pytest.raises(RuntimeError, match="-1728"):
+        _collect(["fail"], [])
@@ -0,0 +1,134 @@
+"""Tests for coalescing concurrent worker requests into batches."""
+
+import asyncio
+
+import pytest
+
+from mcp_apple_notes.applescript.base_operations import _WorkerPool
+
+
+def test_concurrent_submissions_share_one_request(monkeypatch):
+    """Test that submissions within the batch window reach the worker together."""
+    pool = _WorkerPool()
+    frames = []
+
+    async def fake_exchange(request, timeout):
+        frames.append(request)
+        return {
+            "ok": True,
+            "results": [
+                {"ok": True, "result": f"{entry['args'][0]}\n"}
+                for entry in request["batch"]
+            ],
+        }
+
+    monkeypatch.setattr(pool, "_exchange", fake_exchange)
+
+    async def submit_three():
+        return await asyncio.gather(
+            *(pool.submit("on run argv", 5, [str(i)]) for i in range(3))
+        )
+
+    assert asyncio.run(submit_three()) == ["0", "1", "2"]
+    assert len(frames) == 1
+
+
+def test_batch_entry_error_only_fails_its_caller(monkeypatch):
+    """Test that one failing script does not fail the rest of its batch."""
+    pool = _WorkerPool()
+
+    async def fake_exchange(request, timeout):
+        return {
+            "ok": True,
+            "results": [
+                {"ok": True, "result": "fine"},
+                {"ok": False, "error": "Notes got an error"},
+            ],
+        }
+
+    monkeypatch.setattr(pool, "_exchange", fake_exchange)
+
+    async def submit_two():
+        return await asyncio.gather(
+            pool.submit("on run argv", 5, ["a"]),
+            pool.submit("on run argv", 5, ["b"]),
+            return_exceptions=True,
+        )
+
+    ok, failed = asyncio.run(submit_two())
+    assert ok == "fine"
+    assert isinstance(failed, RuntimeError)
+
+
+def test_short_batch_reply_fails_every_caller(monkeypatch):
+    """Test that a reply missing entries fails the batch instead of hanging."""
+    pool = _WorkerPool()
+
+    async def fake_exchange(request, timeout):
+        return {"ok": True, "results": [{"ok": True, "result": "only one"}]}
+
+    monkeypatch.setattr(pool, "_exchange", fake_exchange)
+
+    async def submit_two():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                pool.submit("on run argv", 5, ["a"]),
+                pool.submit("on run argv", 5, ["b"]),
+                return_exceptions=True,
+            ),
+            5,
+        )
+
+    results = asyncio.run(submit_two())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_batch_budget_is_sum_of_entry_timeouts(monkeypatch):
+    """Test that a batch may run as long as its entries would one by one."""
+    pool = _WorkerPool()
+    budgets = []
+
+    async def fake_exchange(request, timeout):
+        budgets.append(timeout)
+        return {
+            "ok": True,
+            "results": [{"ok": True, "result": "done"} for _ in request["batch"]],
+        }
+
+    monkeypatch.setattr(pool, "_exchange", fake_exchange)
+
+    async def submit_two():
+        return await asyncio.gather(
+            pool.submit("on run argv", 30, ["search"]),
+            pool.submit("on run argv", 60, ["find"]),
+        )
+
+    assert asyncio.run(submit_two()) == ["done", "done"]
+    assert budgets == [90]
+
+
+def test_entry_times_out_on_its_own_deadline(monkeypatch):
+    """Test that a short timeout fails only its caller, and on time."""
+    pool = _WorkerPool()
+
+    async def fake_exchange(request, timeout):
+        await asyncio.sleep(0.5)
+        return {
+            "ok": True,
+            "results": [{"ok": True, "result": "done"} for _ in request["batch"]],
+        }
+
+    monkeypatch.setattr(pool, "_exchange", fake_exchange)
+
+    async def submit_two():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        short = pool.submit("on run argv", 0.1, ["short"])
+        long = pool.submit("on run argv", 5, ["long"])
+        with pytest.raises(TimeoutError):
+            await short
+        return loop.time() - started, await long
+
+    waited, long_result = asyncio.run(submit_two())
+    assert waited < 0.5
+    assert long_result == "done"
@@ -0,0 +1,107 @@
+"""Tests for the framed JSON protocol spoken with the osascript worker."""
+
+import asyncio
+
+import pytest
+
+from mcp_apple_notes.applescript.base_operations import BaseAppleScriptOperations
+
+_ECHO_HANDLER = """
+def run(request):
+    if request["args"] is None:
+        return {"ok": True, "result": "success:" + request["script"] + "\\n"}
+    return {"ok": True, "result": ",".join(request["args"])}
+
+
+def handle(request):
+    if "batch" in request:
+        return {"ok": True, "results": [run(entry) for entry in request["batch"]]}
+    return run(request)
+"""
+
+
+def test_plain_script_round_trip(fake_worker):
+    """Test that a plain script's reply reaches the caller as its text."""
+    fake_worker(_ECHO_HANDLER)
+
+    async def run_script():
+        try:
+            return await BaseAppleScriptOperations.execute_applescript("hello")
+        finally:
+            await BaseAppleScriptOperations.stop_worker()
+
+    assert asyncio.run(run_script()) == "success:hello"
+
+
+def test_templates_round_trip_as_one_batch(fake_worker):
+    """Test that concurrent template runs travel in a batch and come back."""
+    fake_worker(_ECHO_HANDLER)
+
+    async def run_templates():
+        try:
+            return await asyncio.gather(
+                BaseAppleScriptOperations.execute_compiled_applescript(
+                    "on run argv", ["a", "b"]
+                ),
+                BaseAppleScriptOperations.execute_compiled_applescript(
+                    "on run argv", ["c"]
+                ),
+            )
+        finally:
+            await BaseAppleScriptOperations.stop_worker()
+
+    assert asyncio.run(run_templates()) == ["a,b", "c"]
+
+
+def test_rejected_batch_fails_its_callers(fake_worker):
+    """Test that a worker-level error reply fails the batch promptly."""
+    fake_worker("""
+        def handle(request):
+            return {"ok": False, "error": "SyntaxError: bad frame"}
+        """)
+
+    async def run_template():
+        try:
+            return await asyncio.wait_for(
+                BaseAppleScriptOperations.execute_compiled_applescript(
+                    "on run argv", ["a"], timeout=1
+                ),
+                5,
+            )
+        finally:
+            await BaseAppleScriptOperations.stop_worker()
+
+    with pytest.raises(RuntimeError, match="bad frame"):
+        asyncio.run(run_template())
+
+
+def test_call_queued_behind_slow_one_times_out(fake_worker):
+    """Test that waiting for the worker counts against a call's timeout."""
+    fake_worker("""
+        import time
+
+
+        def handle(request):
+            if request["script"] == "slow":
+                time.sleep(2)
+            return {"ok": True, "result": request["script"]}
+        """)
+
+    async def run_scripts():
+        try:
+            slow = asyncio.ensure_future(
+                BaseAppleScriptOperations.execute_applescript("slow", timeout=10)
+            )
+            await asyncio.sleep(0.5)
+            started = asyncio.get_running_loop().time()
+            with pytest.raises(TimeoutError):
+                await BaseAppleScriptOperations.execute_applescript("fast", timeout=0.5)
+            waited = asyncio.get_running_loop().time() - started
+            return waited, await slow
+        finally:
+            await BaseAppleScriptOperations.stop_worker()
+
+    waited, slow_result = asyncio.run(run_scripts())
+    assert waited < 1
+    # Giving up in the queue must not kill the worker serving the slow call.
+    assert slow_result == "slow"